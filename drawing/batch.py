@@ -0,0 +1,119 @@
+"""Dávkové odesílání příkazů plátna do Tcl jedním voláním ``eval``.
+
+Každé ``canvas.create_*``, ``coords`` nebo ``itemconfigure`` je jeden
+přechod Python → Tcl. CanvasBatch příkazy jen posbírá jako text skriptu
+a při ``flush()`` je pošle interpretu najednou.
+
+Příklad::
+
+    with CanvasBatch(canvas) as batch:
+        for x in range(0, 400, 20):
+            batch.create("rectangle", x, 0, x + 10, 10, fill="red")
+    ids = batch.ids
+"""
+import re
+
+# Znaky, které mají v Tcl zvláštní význam uvnitř "..."
+_SPECIAL = re.compile(r'([\\"$\[\]])')
+# Znaky, kvůli kterým musí být prvek seznamu Tcl ve složených závorkách
+_LIST_SPECIAL = re.compile(r'[\s{}\\"$\[\];]')
+# Bílé znaky zapsané v prvku seznamu escape sekvencí (\ + nový řádek je v Tcl pokračování řádku)
+_WHITESPACE_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+# Proměnná Tcl, do které se sbírají id nově vytvořených položek
+_IDS = "::canvas_batch_ids"
+
+
+def tcl_word(value):
+    """Převede hodnotu na jedno slovo skriptu Tcl (bezpečně uvozené)."""
+    if isinstance(value, (tuple, list)):
+        value = " ".join(tcl_list_element(v) for v in value)
+    return '"' + _SPECIAL.sub(r"\\\1", str(value)) + '"'
+
+
+def tcl_list_element(value):
+    """Převede hodnotu na prvek seznamu Tcl (např. font ("Segoe UI", 10, "bold"))."""
+    text = str(value)
+    if text and not _LIST_SPECIAL.search(text):
+        return text
+    if "\\" not in text and text.count("{") == text.count("}") == 0:
+        return "{" + text + "}"
+    return _LIST_SPECIAL.sub(lambda m: _WHITESPACE_ESCAPES.get(m.group(), "\\" + m.group()), text)
+
+
+def _options(options):
+    """Volby jako -jméno hodnota (např. fill="red" -> -fill "red")."""
+    return " ".join(f"-{name.rstrip('_')} {tcl_word(value)}" for name, value in options.items())
+
+
+class CanvasBatch:
+    """
+    Sběrač operací nad jedním tk.Canvas.
+    ``create`` vrací pořadí nové položky v dávce; skutečná id jsou po
+    ``flush()`` v seznamu ``ids`` (ve stejném pořadí).
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._path = str(canvas)
+        self._commands = []
+        self._created = 0
+        self.ids = []
+        # počet volání eval (pro měření)
+        self.evals = 0
+
+    def __len__(self):
+        return len(self._commands)
+
+    def create(self, kind, *coords, **options):
+        """Naplánuje vytvoření položky ``kind`` (rectangle, oval, line, text, image…)."""
+        coords = " ".join(tcl_word(c) for c in coords)
+        self._commands.append(f"lappend {_IDS} [{self._path} create {kind} {coords} {_options(options)}]")
+        self._created += 1
+        return self._created - 1
+
+    def coords(self, item, *coords):
+        """Naplánuje přesunutí položky."""
+        self._commands.append(f"{self._path} coords {tcl_word(item)} " + " ".join(tcl_word(c) for c in coords))
+
+    def itemconfigure(self, item, **options):
+        """Naplánuje změnu voleb položky."""
+        if options:
+            self._commands.append(f"{self._path} itemconfigure {tcl_word(item)} {_options(options)}")
+
+    def delete(self, *items):
+        """Naplánuje smazání položek (id nebo tagy, např. "all")."""
+        if items:
+            self._commands.append(f"{self._path} delete " + " ".join(tcl_word(i) for i in items))
+
+    def tag_raise(self, item):
+        """Naplánuje přesun položky nahoru."""
+        self._commands.append(f"{self._path} raise {tcl_word(item)}")
+
+    def flush(self):
+        """
+        Pošle všechny naplánované příkazy jako jeden skript.
+        Returns:
+            list[int]: Id položek vytvořených v této dávce.
+        """
+        if not self._commands:
+            self.ids = []
+            return self.ids
+        # Poslední příkaz vrátí seznam id a zároveň proměnnou smaže
+        script = "\n".join([f"set {_IDS} {{}}", *self._commands,
+                            f"lindex [list [set {_IDS}] [unset {_IDS}]] 0"])
+        self._commands = []
+        self._created = 0
+        self.evals += 1
+        result = self.canvas.tk.eval(script)
+        self.ids = [int(i) for i in self.canvas.tk.splitlist(result)]
+        return self.ids
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._commands = []
+        return False
@@ -0,0 +1,272 @@
+"""Benchmark vykreslování úloh z grafika-funkce.py (čáry, šachovnice, terč).
+
+Každá úloha se vykreslí pro mřížku velikostí plátna a parametrů.
+Měří se čas prvního vykreslení (prázdná scéna i mezipaměť) a opakovaného překreslení,
+počet volání Tcl (``call`` + ``eval``) a počet položek plátna.
+Výsledek se ukládá jako JSON, aby šly porovnat dva commity.
+
+Spuštění (bez monitoru přes Xvfb)::
+
+    xvfb-run -s "-screen 0 3840x2160x24" python -m drawing.benchmark -o before.json
+    python -m drawing.benchmark --quick -o after.json --compare before.json
+
+Pokud chybí proměnná DISPLAY a je nainstalovaný Xvfb, benchmark si ho
+spustí sám. ``--compare`` skončí kódem 1, pokud se některý případ zhoršil.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Soubor s aplikací (název obsahuje pomlčku, proto se načítá přes importlib)
+APP_FILE = Path(__file__).resolve().parent.parent / "grafika-funkce.py"
+# Výchozí mřížka: šířky plátna (výška 16:9) a parametry úloh
+WIDTHS = (640, 1280, 1920, 3840)
+CHESSBOARD_SIZES = (2, 4, 8, 16, 24, 30)
+TARGET_RINGS = (5, 10, 20, 40)
+# Zmenšená mřížka pro rychlou kontrolu (--quick)
+QUICK = {"widths": (640, 1920), "chessboard": (2, 8, 30), "target": (10, 40)}
+# O kolik může být čas horší, než se to při porovnání označí za regresi
+THRESHOLD = 1.25
+
+
+class CountingTk:
+    """Obal interpretu Tcl (``widget.tk``), který počítá volání ``call`` a ``eval``."""
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def eval(self, script):
+        self.calls += 1
+        return self._tk.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def load_app_module(path=APP_FILE):
+    """Načte grafika-funkce.py jako modul."""
+    spec = importlib.util.spec_from_file_location("grafika_funkce", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def start_xvfb(screen="3840x2160x24"):
+    """
+    Spustí Xvfb, pokud není k dispozici displej.
+    Returns:
+        subprocess.Popen nebo None: Proces Xvfb (po skončení je třeba ho ukončit).
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin") or not shutil.which("Xvfb"):
+        return None
+    display = f":{90 + os.getpid() % 100}"
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", screen, "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return proc
+
+
+def cases(widths=WIDTHS, chessboard=CHESSBOARD_SIZES, target=TARGET_RINGS):
+    """Vygeneruje případy (úloha, parametr, šířka, výška) pro mřížku velikostí."""
+    for w in widths:
+        h = w * 9 // 16
+        yield "lines", None, w, h
+        for size in chessboard:
+            yield "chessboard", size, w, h
+        for rings in target:
+            yield "target", rings, w, h
+
+
+def _draw(app, task, param):
+    """Zavolá kreslicí metodu aplikace (čáry s pevným seedem, aby byl vzor stejný)."""
+    if task == "lines":
+        random.seed(0)
+        app.lines(new=True)
+    elif task == "chessboard":
+        app.chessboard(param)
+    else:
+        app.target(param)
+
+
+def _resize(app, w, h):
+    """Nastaví velikost plátna a zahodí překreslení naplánované událostí <Configure>."""
+    app.canvas.config(width=w, height=h)
+    app.root.geometry("")
+    app.root.update()
+    app.scheduler.cancel()
+    return app.canvas.winfo_width(), app.canvas.winfo_height()
+
+
+def measure(app, task, param, w, h, repeat=5):
+    """
+    Změří jeden případ.
+    Returns:
+        dict: Záznam výsledku (časy v sekundách, medián z ``repeat`` překreslení).
+    """
+    counter = app.canvas.tk
+    width, height = _resize(app, w, h)
+    app.clear()
+    app._images.clear()
+    app.cache.clear()
+    app.root.update_idletasks()
+
+    counter.calls = 0
+    start = time.perf_counter()
+    _draw(app, task, param)
+    app.root.update_idletasks()
+    cold = time.perf_counter() - start
+    cold_calls = counter.calls
+
+    times = []
+    counter.calls = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _draw(app, task, param)
+        app.root.update_idletasks()
+        times.append(time.perf_counter() - start)
+    redraw_calls = counter.calls // max(repeat, 1)
+
+    return {
+        "task": task, "param": param, "mode": app.render_mode.get(),
+        "width": width, "height": height,
+        "cold_s": cold, "redraw_s": statistics.median(times) if times else None,
+        "tcl_calls": cold_calls, "tcl_calls_redraw": redraw_calls,
+        "items": len(app.canvas.find_all()),
+    }
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_FILE.parent,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(case_list, modes=("auto",), repeat=5, progress=None):
+    """
+    Spustí benchmark nad jednou instancí aplikace.
+    Args:
+        case_list (list[tuple]): Případy z ``cases()``.
+        modes (tuple[str]): Režimy vykreslení ("auto", "items", "image").
+        repeat (int): Počet opakovaných překreslení na případ.
+        progress (callable): Volá se s každým hotovým záznamem.
+    Returns:
+        dict: {"meta": {...}, "results": [...]} připravené pro JSON.
+    """
+    module = load_app_module()
+    app = module.App()
+    # Všechna volání Tcl jdou přes widget.tk – obalíme plátno i okno
+    counter = CountingTk(app.canvas.tk)
+    app.canvas.tk = counter
+    app.root.tk = counter
+    results = []
+    try:
+        for mode in modes:
+            app.render_mode.set(mode)
+            for task, param, w, h in case_list:
+                record = measure(app, task, param, w, h, repeat)
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+        tk_version = app.root.tk.call("info", "patchlevel")
+    finally:
+        app.root.destroy()
+    meta = {
+        "commit": _git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "tk": tk_version,
+        "platform": platform.platform(),
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def _case_key(record):
+    return record["task"], record["param"], record["mode"], record["width"], record["height"]
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """
+    Porovná dva výsledky benchmarku.
+    Regrese je případ, kde je čas překreslení větší než ``threshold`` ×
+    původní, nebo kde přibylo volání Tcl či položek plátna.
+    Returns:
+        list[dict]: Záznamy {"case", "field", "before", "after", "ratio"} s regresemi.
+    """
+    before = {_case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        old = before.get(_case_key(record))
+        if old is None:
+            continue
+        for field in ("redraw_s", "cold_s", "tcl_calls", "tcl_calls_redraw", "items"):
+            a, b = old.get(field), record.get(field)
+            if a is None or b is None:
+                continue
+            limit = a * threshold if field.endswith("_s") else a
+            if b > limit:
+                regressions.append({"case": _case_key(record), "field": field, "before": a, "after": b,
+                                    "ratio": b / a if a else float("inf")})
+    return regressions
+
+
+def _format_record(r):
+    param = "" if r["param"] is None else r["param"]
+    return (f"{r['task']:<11}{param!s:>4} {r['mode']:<6}{r['width']:>5}×{r['height']:<5}"
+            f"  první {r['cold_s'] * 1000:8.2f} ms  překreslení {r['redraw_s'] * 1000:8.2f} ms"
+            f"  Tcl {r['tcl_calls']:>6}/{r['tcl_calls_redraw']:<6}  položek {r['items']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark vykreslování úloh grafika-funkce.py")
+    parser.add_argument("-o", "--output", help="Soubor JSON pro výsledky")
+    parser.add_argument("--compare", metavar="JSON", help="Porovnat s dřívějším výsledkem")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"Povolené zhoršení času (výchozí {THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=5, help="Počet překreslení na případ")
+    parser.add_argument("--modes", default="auto", help="Režimy vykreslení oddělené čárkou (auto,items,image)")
+    parser.add_argument("--quick", action="store_true", help="Zmenšená mřížka velikostí")
+    args = parser.parse_args(argv)
+
+    grid = QUICK if args.quick else {"widths": WIDTHS, "chessboard": CHESSBOARD_SIZES, "target": TARGET_RINGS}
+    xvfb = start_xvfb()
+    try:
+        result = run(list(cases(**grid)), modes=tuple(args.modes.split(",")), repeat=args.repeat,
+                     progress=lambda r: print(_format_record(r), flush=True))
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(baseline, result, args.threshold)
+        for reg in regressions:
+            print(f"REGRESE {reg['case']} {reg['field']}: {reg['before']} → {reg['after']} (×{reg['ratio']:.2f})")
+        if regressions:
+            return 1
+        print(f"Bez regresí oproti {baseline['meta'].get('commit') or args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
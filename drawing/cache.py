@@ -0,0 +1,91 @@
+"""LRU mezipaměť hotových scén (rozvržení položek a rastrových obrázků).
+
+Klíčem jsou parametry scény a velikost plátna, např.
+``("target", rings, w, h)``. Hodnotou je buď rozvržení – seznam položek
+``(typ, klíč, souřadnice, volby)`` pro Scene.draw() – nebo tk.PhotoImage
+z drawing.raster. Při návratu ke stejné úloze nebo velikosti okna se scéna
+nepočítá (ani nerastruje) znovu.
+"""
+import sys
+import tkinter as tk
+from collections import OrderedDict
+
+# Výchozí limity mezipaměti
+MAX_BYTES = 64 * 1024 * 1024
+MAX_ENTRIES = 128
+
+
+def estimate_size(value):
+    """Přibližná velikost hodnoty v bajtech (obrázek 4 B na pixel)."""
+    if isinstance(value, tk.PhotoImage):
+        return value.width() * value.height() * 4
+    size = sys.getsizeof(value)
+    for kind, key, coords, options in value:
+        size += sys.getsizeof(coords) + sys.getsizeof(options) + 8 * len(coords) + 64
+    return size
+
+
+class SceneCache:
+    """
+    Mezipaměť s vyřazováním nejdéle nepoužitých položek (LRU).
+    Vyřazuje se, když počet položek překročí ``max_entries`` nebo součet
+    odhadnutých velikostí ``max_bytes``. Vyřazený obrázek zůstane platný,
+    dokud na něj drží odkaz někdo jiný (např. právě zobrazená scéna).
+    Počítadla ve ``stats``: hits, misses, evictions.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES, max_entries=MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        # klíč -> (hodnota, velikost); pořadí = od nejdéle nepoužité
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Vrátí uloženou hodnotu (a označí ji jako nedávno použitou)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return default
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def put(self, key, value, size=None):
+        """Uloží hodnotu; příliš velká hodnota (nad ``max_bytes``) se neukládá."""
+        size = estimate_size(value) if size is None else size
+        self.discard(key)
+        if size > self.max_bytes:
+            return value
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (_, old_size) = self._entries.popitem(last=False)
+            self.nbytes -= old_size
+            self.stats["evictions"] += 1
+        return value
+
+    def get_or_build(self, key, build):
+        """Vrátí uloženou hodnotu, nebo ji vytvoří funkcí ``build()`` a uloží."""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, build())
+        return value
+
+    def discard(self, key):
+        """Odebere jednu položku (pokud existuje)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def clear(self):
+        """Vyprázdní mezipaměť."""
+        self._entries.clear()
+        self.nbytes = 0
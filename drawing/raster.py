@@ -0,0 +1,93 @@
+"""Rastrové vykreslení hustých vzorů do jednoho tk.PhotoImage.
+
+Místo tisíců položek plátna (čar, obdélníků) se vzor nakreslí do jediného
+obrázku. Řádky pixelů, které se opakují, se zapíší jedním voláním
+``PhotoImage.put`` s parametrem ``to`` – Tk je sám zopakuje (dlaždice)
+přes celou oblast. Počet volání Tcl tak závisí jen na počtu pásů vzoru,
+ne na počtu pixelů.
+"""
+import math
+import tkinter as tk
+
+# Výchozí barvy rastrového vykreslení (PhotoImage potřebuje plné #rrggbb)
+BACKGROUND = "#ffffff"
+OUTLINE = "#333333"
+
+
+def ensure_image(master, image, w, h):
+    """Vrátí PhotoImage velikosti w×h – existující obrázek se jen vyčistí a zvětší/zmenší."""
+    if image is None:
+        return tk.PhotoImage(master=master, width=w, height=h)
+    image.blank()
+    if (image.width(), image.height()) != (w, h):
+        image.configure(width=w, height=h)
+    return image
+
+
+def _row(colors):
+    """Jeden řádek pixelů ve formátu pro PhotoImage.put."""
+    return "{" + " ".join(colors) + "}"
+
+
+def lines_pixels(stripes, w, background=BACKGROUND):
+    """
+    Barvy jednoho řádku pixelů pro svislé čáry.
+    Čára na souřadnici x s tloušťkou t zabírá pixely <x - t/2, x + t/2),
+    pozdější čáry překreslí dřívější (stejně jako na plátně).
+    Args:
+        stripes (list[tuple]): Čáry jako (x, tloušťka, barva).
+        w (int): Šířka v pixelech.
+    Returns:
+        list[str]: Barva každého pixelu řádku.
+    """
+    pixels = [background] * w
+    for x, weight, color in stripes:
+        # Zaokrouhlení polovin vždy nahoru (round() by je zaokrouhlil k sudému číslu
+        # a liché tloušťky by pak vyšly o pixel užší nebo širší)
+        start = max(math.floor(x - weight / 2 + 0.5), 0)
+        stop = min(math.floor(x + weight / 2 + 0.5), w)
+        if start >= w:
+            break
+        pixels[start:stop] = [color] * (stop - start)
+    return pixels
+
+
+def render_lines(master, image, stripes, w, h):
+    """
+    Vykreslí svislé čáry do obrázku w×h.
+    Všechny řádky jsou stejné, stačí tedy jediné volání put.
+    Returns:
+        tk.PhotoImage: Obrázek (``image`` nebo nově vytvořený).
+    """
+    image = ensure_image(master, image, w, h)
+    image.put(_row(lines_pixels(stripes, w)), to=(0, 0, w, h))
+    return image
+
+
+def chessboard_edges(size, board):
+    """Celočíselné hrany polí šachovnice (size + 1 hodnot od 0 do board)."""
+    return [int(round(i * board / size)) for i in range(size + 1)]
+
+
+def render_chessboard(master, image, size, board, light, dark, outline=OUTLINE):
+    """
+    Vykreslí šachovnici size×size o straně ``board`` pixelů včetně mřížky.
+    Každý řádek polí je jeden pás se stejnými řádky pixelů (jedno volání
+    put), čáry mřížky jsou další jednobarevné pásy.
+    Returns:
+        tk.PhotoImage: Obrázek velikosti (board + 1)×(board + 1).
+    """
+    side = board + 1
+    image = ensure_image(master, image, side, side)
+    edges = chessboard_edges(size, board)
+    for r in range(size):
+        pixels = [outline] * side
+        for c in range(size):
+            fill = light if (r + c) % 2 == 0 else dark
+            pixels[edges[c] + 1:edges[c + 1]] = [fill] * (edges[c + 1] - edges[c] - 1)
+        if edges[r + 1] - edges[r] > 1:
+            image.put(_row(pixels), to=(0, edges[r] + 1, side, edges[r + 1]))
+    # Vodorovné čáry mřížky (svislé jsou už v pásech)
+    for y in edges:
+        image.put(outline, to=(0, y, side, y + 1))
+    return image
@@ -0,0 +1,59 @@
+"""Plánovač překreslení: slučuje události <Configure> do nejvýše jednoho překreslení za snímek."""
+import time
+
+
+class FrameScheduler:
+    """
+    Požadavky na překreslení se neprovádí hned, ale naplánují se přes
+    ``after_idle``/``after``. Další požadavky do té doby jen nahradí čekající
+    (zastaralé mezivelikosti okna se zahodí) a mezi dvěma překresleními
+    uplyne alespoň ``frame_ms`` milisekund.
+    Počítadla ve ``stats``: requested (požadavky), drawn (provedená
+    překreslení), skipped (požadavky sloučené do jiného překreslení).
+    """
+
+    def __init__(self, widget, frame_ms=16):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self._pending = None
+        self._after_id = None
+        self._last = None
+        self.stats = {"requested": 0, "drawn": 0, "skipped": 0}
+
+    def request(self, callback):
+        """Naplánuje ``callback`` na nejbližší volný snímek."""
+        self.stats["requested"] += 1
+        if self._pending is not None:
+            self.stats["skipped"] += 1
+        self._pending = callback
+        if self._after_id is not None:
+            return
+        wait = 0 if self._last is None else self.frame_ms - (time.perf_counter() - self._last) * 1000
+        if wait <= 0:
+            self._after_id = self.widget.after_idle(self._run)
+        else:
+            self._after_id = self.widget.after(int(wait) + 1, self._run)
+
+    def cancel(self):
+        """Zahodí čekající překreslení."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if self._pending is not None:
+            self.stats["skipped"] += 1
+            self._pending = None
+
+    def flush(self):
+        """Provede čekající překreslení hned."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._run()
+
+    def _run(self):
+        self._after_id = None
+        callback, self._pending = self._pending, None
+        if callback is None:
+            return
+        self._last = time.perf_counter()
+        self.stats["drawn"] += 1
+        callback()
@@ -1,15 +1,71 @@
+import time
+# Čas spuštění – pro zprávu o startu (--startup-report)
+_STARTED = time.perf_counter()
+import sys
 import tkinter as tk
 import random, math
 from tkinter import simpledialog, colorchooser
+from drawing.scene import Scene
+from drawing.scheduler import FrameScheduler
+from drawing import raster
+from drawing.cache import SceneCache
+# Menu Happiness se jen zaregistruje, data a dialogy se načtou až při prvním použití
+from happiness.lazy_menu import attach_lazy_menu, IMPORT_TIMES
+_IMPORTED = time.perf_counter()
 
-try:
-    from happiness.ui_menu import attach_happiness_menu
-except Exception:
-    attach_happiness_menu = None
+# Od kolika čar / polí na stranu se v režimu "auto" kreslí do jednoho obrázku
+RASTER_MIN_LINES = 256
+RASTER_MIN_CHESSBOARD = 16
+
+
+def chessboard_layout(size, w, h, light, dark, margin=10):
+    """Rozvržení šachovnice size×size vycentrované do plátna w×h (položky pro Scene.draw)."""
+    board = min(w, h) - 2 * margin
+    if board <= 0:
+        return []
+    cell = board / size
+    x0 = (w - board) / 2
+    y0 = (h - board) / 2
+    layout = []
+    for r in range(size):
+        for c in range(size):
+            x1 = x0 + c*cell
+            y1 = y0 + r*cell
+            x2 = x1 + cell
+            y2 = y1 + cell
+            fill = light if (r + c) % 2 == 0 else dark
+            layout.append(("rectangle", ("chess", r, c), (x1, y1 , x2, y2), {"fill": fill, "outline": "#333"}))
+    return layout
+
+
+def target_layout(rings, w, h):
+    """Rozvržení terče: soustředné kružnice se skóre prstenců (10 uprostřed → 1 na okraji)."""
+    cx, cy = w/2, h/2
+    R = int(min(w, h) * 0.45)
+    step = R / rings
+    font = ("Segoe UI", 10, "bold")
+    layout = []
+    # střídání barev pro čitelnost
+    for i in range(rings, 0, -1):
+        r = i*step
+        color = "#ffdede" if i%2==0 else "#ffffff"
+        layout.append(("oval", ("ring", i), (cx-r, cy-r, cx+r, cy+r), {"fill": color, "outline": "#333"}))
+        score = rings - i + 1  # 1..10
+        # vyznač skóre na pravé straně prstence
+        if score < rings:  # největší prstenec nemá skóre
+            label = {"text": str(score), "font": font}
+            layout.append(("text", ("score", i, "e"), (cx + r - step/2, cy), label))
+            layout.append(("text", ("score", i, "w"), (cx - r + step/2, cy), label))
+            layout.append(("text", ("score", i, "s"), (cx, cy + r - step/2), label))
+            layout.append(("text", ("score", i, "n"), (cx, cy - r + step/2), label))
+    # středová tečka
+    layout.append(("oval", "center", (cx-2, cy-2, cx+2, cy+2), {"fill": "#333", "outline": ""}))
+    return layout
 
 
 class App:
-    def __init__(self):
+    def __init__(self, frame_ms: int = 16, cache_bytes: int = 64 * 1024 * 1024):
+        init_start = time.perf_counter()
         self.root = tk.Tk()
         self.root.title("Jednoduché menu – barvy + úlohy")
         self.root.geometry("800x800")
@@ -17,6 +73,18 @@ class App:
         # Canvas pro vykreslování
         self.canvas = tk.Canvas(self.root, bg="white")
         self.canvas.pack(fill="both", expand=True)
+        # Scéna drží položky plátna, při překreslení je jen posouvá/přebarvuje
+        self.scene = Scene(self.canvas)
+        # Plánovač slučuje překreslení při změně velikosti (nejvýše 1 za snímek)
+        self.scheduler = FrameScheduler(self.canvas, frame_ms=frame_ms)
+        # Vzor čar (x, tloušťka, barva) – při změně velikosti zůstává stejný
+        self._stripes = []
+        # Režim vykreslení hustých vzorů: "auto", "items" (položky plátna), "image" (jeden obrázek)
+        self.render_mode = tk.StringVar(master=self.root, value="auto")
+        # Obrázky rastrového režimu (znovu se používají při překreslení)
+        self._images = {}
+        # Hotová rozvržení a obrázky scén podle parametrů a velikosti plátna (LRU)
+        self.cache = SceneCache(max_bytes=cache_bytes)
 
         # Menu
         menubar = tk.Menu(self.root)
@@ -34,20 +102,29 @@ class App:
 
         # Úlohy
         m_tasks = tk.Menu(menubar, tearoff=False)
-        m_tasks.add_command(label="Čáry", command=self.lines)
+        m_tasks.add_command(label="Čáry", command=lambda: self.lines(new=True))
         # m_tasks.add_command(label="Šachovnice", command=lambda: self.chessboard())
         m_tasks.add_command(label="Šachovnice", command=self.chessboard_dialog)
         m_tasks.add_command(label="Terč", command=self.target)
         menubar.add_cascade(label="Úlohy", menu=m_tasks)
 
+        # Způsob vykreslení hustých vzorů (čáry, velká šachovnice)
+        m_render = tk.Menu(menubar, tearoff=False)
+        m_render.add_radiobutton(label="Automaticky", variable=self.render_mode, value="auto", command=self.redraw)
+        m_render.add_radiobutton(label="Položky plátna", variable=self.render_mode, value="items", command=self.redraw)
+        m_render.add_radiobutton(label="Jeden obrázek", variable=self.render_mode, value="image", command=self.redraw)
+        menubar.add_cascade(label="Vykreslování", menu=m_render)
+
         # po vytvoření menubar:
-        if attach_happiness_menu:
-            self._happy = attach_happiness_menu(self.root, menubar)
+        self._happy = attach_lazy_menu(self.root, menubar)
 
         # Při změně velikosti překreslit poslední úlohu (jednoduše zavoláme znovu)
         self._last_draw = None
-        # Událost <Configure> se vyvolá při změně velikosti okna, připneme k ní lambda funkci, která zavolá poslední vykreslovací funkci, pokud existuje
-        self.canvas.bind("<Configure>", lambda e: self._last_draw and self._last_draw())
+        # Událost <Configure> se vyvolá při změně velikosti okna; překreslení nevoláme hned,
+        # ale přes plánovač, který sloučí všechny události do jednoho překreslení za snímek
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        # Doby startu v sekundách (zobrazí startup_report)
+        self.startup = {"import": _IMPORTED - _STARTED, "init": time.perf_counter() - init_start}
 
     # ----------------- Helpers -----------------
     def _canvas_size(self):
@@ -56,46 +133,76 @@ class App:
         return w, h
 
     def clear(self):
-        self.canvas.delete("all")
+        self.scene.clear()
+
+    def _use_raster(self, dense: bool) -> bool:
+        """Kreslit do obrázku? V režimu "auto" jen u hustých vzorů."""
+        mode = self.render_mode.get()
+        return mode == "image" or (mode == "auto" and dense)
+
+    def _image(self, name, render, *args):
+        """Vykreslí rastr funkcí ``render`` do obrázku ``name`` (obrázek se znovu používá)."""
+        self._images[name] = render(self.canvas, self._images.get(name), *args)
+        return self._images[name]
+
+    def redraw(self):
+        """Naplánuje překreslení poslední úlohy (velikost plátna se zjistí až při kreslení)."""
+        if self._last_draw:
+            self.scheduler.request(lambda: self._last_draw and self._last_draw())
 
     # ----------------- Barvy -------------------
     def set_bg(self, color: str):
         self.canvas.config(bg=color)
         self._last_draw = None
+        self.scheduler.cancel()
 
     # ----------------- Úlohy -------------------
-    def lines(self):
+    def lines(self, new: bool = False):
         """Vykreslí náhodně tučné, náhodně barevné svislé čáry zleva doprava."""
-        self.clear()
         self.canvas.config(bg="white")
         w, h = self._canvas_size()
-        x = 0
+        if new:
+            self._stripes = []
+        # Vzor si pamatujeme; při zvětšení okna ho jen doplníme doprava
+        x = self._stripes[-1][0] + self._stripes[-1][1] if self._stripes else 0
         while x < w:
             weight = random.randint(1, 8)
             color = f"#{random.randint(0,0xFFFFFF):06x}"
-            self.canvas.create_line(x, 0, x, h, fill=color, width=weight)
+            self._stripes.append((x, weight, color))
             x += weight
+        visible = [stripe for stripe in self._stripes if stripe[0] < w]
+        self.scene.begin()
+        if self._use_raster(len(visible) >= RASTER_MIN_LINES):
+            # Všechny čáry v jednom obrázku místo tisíců položek plátna
+            image = self._image("lines", raster.render_lines, visible, w, h)
+            self.scene.image("lines-image", 0, 0, image=image, anchor="nw")
+        else:
+            for i, (x, weight, color) in enumerate(visible):
+                self.scene.line(("line", i), x, 0, x, h, fill=color, width=weight)
+        self.scene.end()
+        self._last_draw = self.lines
 
     def chessboard(self, size: int = 8, light="#f0d9b5", dark="#b58863"):
         """Vykreslí šachovnici size×size vycentrovanou do plátna."""
-        self.clear()
         self.canvas.config(bg="white")
+        self._last_draw = lambda: self.chessboard(size, light, dark)
         w, h = self._canvas_size()
         margin = 10
         board = min(w, h) - 2 * margin
-        if board <= 0:
-            return
-        cell = board / size
-        x0 = (w - board) / 2
-        y0 = (h - board) / 2
-        for r in range(size):
-            for c in range(size):
-                x1 = x0 + c*cell
-                y1 = y0 + r*cell
-                x2 = x1 + cell
-                y2 = y1 + cell
-                fill = light if (r + c) % 2 == 0 else dark
-                self.canvas.create_rectangle(x1, y1 , x2, y2, fill=fill, outline="#333")
+        self.scene.begin()
+        if board > 0 and self._use_raster(size >= RASTER_MIN_CHESSBOARD):
+            # Obrázek závisí jen na straně šachovnice, ne na velikosti plátna
+            image = self.cache.get_or_build(
+                ("chessboard-image", size, board, light, dark),
+                lambda: raster.render_chessboard(self.canvas, None, size, int(board), light, dark))
+            # Zobrazený obrázek držíme, i kdyby ho mezipaměť vyřadila
+            self._images["chessboard"] = image
+            self.scene.image("chess-image", int((w - board) / 2), int((h - board) / 2), image=image, anchor="nw")
+        else:
+            self.scene.draw(self.cache.get_or_build(
+                ("chessboard", size, w, h, light, dark),
+                lambda: chessboard_layout(size, w, h, light, dark, margin)))
+        self.scene.end()
 
     def chessboard_dialog(self):
         # zadání velikosti
@@ -126,40 +233,36 @@ class App:
         if not dark_color:
             dark_color = "#b58863"
 
-        # vykreslení šachovnice s barvami
+        # vykreslení šachovnice s barvami (chessboard si sám nastaví _last_draw)
         self.chessboard(size=size, light=light_color, dark=dark_color)
-        self._last_draw = lambda s=size, l=light_color, d=dark_color: self.chessboard(s, l, d)
 
 
     def target(self, rings: int = 10):
         """Soustředné kružnice se skóre prstenců (10 uprostřed → 1 na okraji)."""
-        self.clear()
         self.canvas.config(bg="white")
+        self._last_draw = lambda: self.target(rings)
         w, h = self._canvas_size()
-        cx, cy = w/2, h/2
-        R = int(min(w, h) * 0.45)
-        step = R / rings
-        # střídání barev pro čitelnost
-        for i in range(rings, 0, -1):
-            r = i*step
-            color = "#ffdede" if i%2==0 else "#ffffff"
-            self.canvas.create_oval(cx-r, cy-r, cx+r, cy+r, fill=color, outline="#333")
-            score = rings - i + 1  # 1..10
-            # vyznač skóre na pravé straně prstence
-            if score < rings:  # největší prstenec nemá skóre
-                tx = cx + r - step/2
-                self.canvas.create_text(tx, cy, text=str(score), font=("Segoe UI", 10, "bold"))
-                tx = cx - r + step / 2
-                self.canvas.create_text(tx, cy, text=str(score), font=("Segoe UI", 10, "bold"))
-                ty = cy + r - step/2
-                self.canvas.create_text(cx, ty, text=str(score), font=("Segoe UI", 10, "bold"))
-                ty = cy - r + step/2
-                self.canvas.create_text(cx, ty, text=str(score), font=("Segoe UI", 10, "bold"))
-        # středová tečka
-        self.canvas.create_oval(cx-2, cy-2, cx+2, cy+2, fill="#333", outline="")
-
-    def run(self):
+        self.scene.begin()
+        self.scene.draw(self.cache.get_or_build(("target", rings, w, h), lambda: target_layout(rings, w, h)))
+        self.scene.end()
+
+    def startup_report(self) -> str:
+        """Zpráva o době startu (import modulů, vytvoření okna, zobrazení) a líných importech."""
+        lines = [f"Import modulů:    {self.startup['import'] * 1000:8.1f} ms",
+                 f"Vytvoření okna:   {self.startup['init'] * 1000:8.1f} ms"]
+        if "ready" in self.startup:
+            lines.append(f"Okno připraveno:  {self.startup['ready'] * 1000:8.1f} ms od startu")
+        for name, seconds in IMPORT_TIMES.items():
+            lines.append(f"Líný import {name}: {seconds * 1000:.1f} ms")
+        return "\n".join(lines)
+
+    def run(self, report: bool = False):
+        if report:
+            # Okno je připravené, až Tk zpracuje čekající práci (vykreslení, rozmístění)
+            self.root.update_idletasks()
+            self.startup["ready"] = time.perf_counter() - _STARTED
+            print(self.startup_report(), file=sys.stderr)
         self.root.mainloop()
 
 if __name__ == "__main__":
-    App().run()
\ No newline at end of file
+    App().run(report="--startup-report" in sys.argv)
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Spouštění dlouhých operací mimo hlavní vlákno Tk s ukazatelem průběhu."""
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from .data_loader import Cancelled
+
+
+class BackgroundTask:
+    """
+    Spustí funkci ``work(progress, cancel)`` v samostatném vlákně.
+    Vlákno nikdy nesahá na widgety: průběh i výsledek posílá do fronty,
+    kterou hlavní vlákno vybírá přes ``root.after``. Během práce je
+    zobrazeno okno s ukazatelem průběhu a tlačítkem Zrušit.
+    Args:
+        root: Hlavní okno Tk.
+        title (str): Titulek okna s průběhem.
+        work (callable): Funkce work(progress, cancel) vracející výsledek.
+        on_done (callable): Volá se v hlavním vlákně s výsledkem.
+        on_error (callable): Volá se v hlavním vlákně s výjimkou.
+        on_cancel (callable): Volá se v hlavním vlákně po zrušení.
+    """
+    POLL_MS = 50
+
+    def __init__(self, root, title, work, on_done, on_error=None, on_cancel=None):
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.queue = queue.Queue()
+        self.cancel_event = threading.Event()
+
+        # Okno s ukazatelem průběhu
+        self.window = tk.Toplevel(root)
+        self.window.title(title)
+        self.window.resizable(False, False)
+        self.window.transient(root)
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.label = ttk.Label(self.window, text=title)
+        self.label.pack(anchor="w", padx=12, pady=(12, 4))
+        self.bar = ttk.Progressbar(self.window, length=320, maximum=100, mode="determinate")
+        self.bar.pack(padx=12, pady=4)
+        ttk.Button(self.window, text="Zrušit", command=self.cancel).pack(anchor="e", padx=12, pady=(4, 12))
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.root.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        """Požádá vlákno o ukončení (projeví se při nejbližší kontrole)."""
+        self.cancel_event.set()
+        self.label.config(text="Ruším…")
+
+    def _progress(self, fraction):
+        # Voláno z pracovního vlákna – jen vložení do fronty
+        self.queue.put(("progress", fraction))
+
+    def _run(self):
+        try:
+            result = self.work(progress=self._progress, cancel=self.cancel_event)
+        except Cancelled:
+            self.queue.put(("cancelled", None))
+        except Exception as e:
+            self.queue.put(("error", e))
+        else:
+            self.queue.put(("done", result))
+
+    def _poll(self):
+        # Zpracujeme vše, co vlákno mezitím poslalo
+        try:
+            while True:
+                kind, value = self.queue.get_nowait()
+                if kind == "progress":
+                    self.bar["value"] = value * 100
+                    continue
+                self.window.destroy()
+                if kind == "done":
+                    self.on_done(value)
+                elif kind == "error" and self.on_error:
+                    self.on_error(value)
+                elif kind == "cancelled" and self.on_cancel:
+                    self.on_cancel()
+                return
+        except queue.Empty:
+            pass
+        self.root.after(self.POLL_MS, self._poll)
@@ -0,0 +1,145 @@
+"""Binární cache již načtených (typovaných) dat Indexu štěstí."""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from .dataset import ColumnarData
+
+# Hlavička souboru cache: identifikace formátu a délka JSON metadat
+MAGIC = b"HAPPYC1\n"
+HEADER = struct.Struct("<Q")
+# Výchozí složka cache vedle zdrojového CSV
+CACHE_DIR = ".happiness_cache"
+
+
+def cache_path(csv_path, cache_dir=None):
+    """Vrátí cestu k souboru cache pro daný CSV soubor."""
+    csv_path = Path(csv_path)
+    directory = Path(cache_dir) if cache_dir else csv_path.parent / CACHE_DIR
+    return directory / (csv_path.name + ".bin")
+
+
+def file_hash(path):
+    """Spočítá SHA-256 obsahu souboru (po blocích)."""
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_info(path, with_hash=True):
+    """Otisk zdrojového souboru: čas změny, velikost a (volitelně) hash."""
+    st = Path(path).stat()
+    info = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    if with_hash:
+        info["sha256"] = file_hash(path)
+    return info
+
+
+def write_cache(data, target, source):
+    """
+    Uloží sloupcová data do binárního souboru.
+    Číselné sloupce se zapíší jako surová pole double, textové do JSON hlavičky.
+    Args:
+        data (ColumnarData): Data k uložení.
+        target (Path): Cesta k souboru cache.
+        source (dict): Otisk zdrojového souboru (viz source_info).
+    """
+    offsets, offset = {}, 0
+    for name, col in data.numeric.items():
+        offsets[name] = offset
+        offset += len(col) * 8
+    meta = {
+        "source": source,
+        "byteorder": sys.byteorder,
+        "columns": data.columns,
+        "length": len(data),
+        "numeric": offsets,
+        "text": data.text,
+    }
+    header = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    # Číselná data zarovnáme na 8 bajtů, aby šla číst přímo jako double
+    start = len(MAGIC) + HEADER.size + len(header)
+    padding = b"\0" * (-start % 8)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(len(header) + len(padding)))
+        f.write(header + padding)
+        for col in data.numeric.values():
+            f.write(col)
+    # Atomická výměna – souběžný čtenář nikdy neuvidí rozepsaný soubor
+    os.replace(tmp, target)
+
+
+def read_cache(target):
+    """
+    Otevře soubor cache bez parsování: číselné sloupce jsou pohledy
+    (memoryview) přímo do paměťově mapovaného souboru.
+    Returns:
+        tuple[dict, ColumnarData]: Metadata a data.
+    Raises:
+        ValueError: Pokud soubor není platná cache.
+    """
+    with target.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Soubor {target} není cache dat štěstí.")
+    (header_len,) = HEADER.unpack_from(mm, len(MAGIC))
+    start = len(MAGIC) + HEADER.size
+    meta = json.loads(bytes(mm[start:start + header_len]).rstrip(b"\0"))
+    if meta["byteorder"] != sys.byteorder:
+        raise ValueError("Cache byla vytvořena na platformě s jiným pořadím bajtů.")
+    base = start + header_len
+    n = meta["length"]
+    view = memoryview(mm)
+    numeric = {name: view[base + off:base + off + n * 8].cast("d") for name, off in meta["numeric"].items()}
+    text = {name: [sys.intern(v) for v in values] for name, values in meta["text"].items()}
+    return meta, ColumnarData(meta["columns"], numeric, text)
+
+
+def load_cached(csv_path, parse, cache_dir=None):
+    """
+    Vrátí data z cache, pokud odpovídá zdrojovému souboru, jinak data
+    načte funkcí ``parse`` a cache přestaví.
+    Cache je platná, když sedí velikost a čas změny zdroje; při shodné
+    velikosti, ale jiném čase se ještě porovná hash obsahu.
+    Args:
+        csv_path (str): Cesta ke zdrojovému CSV.
+        parse (callable): Funkce bez argumentů, která vrátí ColumnarData.
+        cache_dir (str): Složka pro cache (výchozí vedle CSV).
+    Returns:
+        ColumnarData: Načtená data.
+    """
+    target = cache_path(csv_path, cache_dir)
+    current = source_info(csv_path, with_hash=False)
+    try:
+        meta, data = read_cache(target)
+        cached = meta["source"]
+        if cached["size"] == current["size"]:
+            if cached["mtime_ns"] == current["mtime_ns"]:
+                return data
+            digest = file_hash(csv_path)
+            if cached["sha256"] == digest:
+                # Obsah se nezměnil (jen čas) – obnovíme otisk, ať se příště nehashuje
+                try:
+                    write_cache(data, target, dict(current, sha256=digest))
+                except OSError:
+                    pass
+                return data
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = parse()
+    try:
+        write_cache(data, target, source_info(csv_path))
+    except OSError:
+        # Cache je jen zrychlení – nezapisovatelná složka nesmí načtení zastavit
+        pass
+    return data
@@ -1,17 +1,123 @@
 """ Modul pro načítání dat Indexu štěstí ze souboru CSV. """
 # import vestavěného modulu csv pro práci se soubory CSV
 import csv
+import re
+from typing import NamedTuple
+# pool vláken pro souběžné načítání více souborů
+from concurrent.futures import ThreadPoolExecutor
 # import Path z modulu pathlib pro práci s cestami k souborům
 from pathlib import Path
+# sloupcové uložení dat
+from .dataset import ColumnarData, Panel, number_parser
+# binární cache načtených dat
+from .cache import load_cached
+# seznam záznamů s indexem pro vyhledávání
+from .index import IndexedRows
 
+# Název ročního souboru, např. world_happiness_2019.csv
+YEAR_FILE = re.compile(r"world_happiness_(\d{4})\.csv")
+# Sjednocení názvů sloupců mezi ročníky (starý název -> jednotný název)
+SCHEMA_ALIASES = {
+    "Ladder score": "Happiness score",
+    "Country name": "Country",
+}
+# Číslo s desetinnou čárkou, např. 7,7689
+DECIMAL_COMMA = re.compile(r"-?\d+,\d+")
 
-def load_data(csv_path="world_happiness_2024.csv", delimiter=';'):
+
+class Cancelled(Exception):
+    """Načítání (nebo jiné dlouhé zpracování) bylo zrušeno uživatelem."""
+
+
+class CsvFormat(NamedTuple):
+    """Zjištěný formát CSV souboru."""
+    delimiter: str
+    decimal: str
+    columns: list
+    numeric: frozenset
+
+
+def sniff_format(csv_path, sample_size=8192):
+    """
+    Z ukázky začátku souboru zjistí oddělovač, desetinný oddělovač
+    a sjednocené názvy sloupců.
+    Args:
+        csv_path (str): Cesta k CSV souboru.
+        sample_size (int): Kolik znaků ze začátku souboru prozkoumat.
+    Returns:
+        CsvFormat: Zjištěný formát souboru.
+    """
+    with Path(csv_path).open(encoding="utf-8") as f:
+        sample = f.read(sample_size)
+    # Poslední řádek ukázky může být useknutý – zahodíme ho
+    lines = sample.splitlines()
+    if len(sample) == sample_size and len(lines) > 2:
+        lines = lines[:-1]
+    try:
+        delimiter = csv.Sniffer().sniff("\n".join(lines), delimiters=";,\t").delimiter
+    except csv.Error:
+        header = lines[0] if lines else ""
+        delimiter = ";" if header.count(";") >= header.count(",") else ","
+
+    rows = list(csv.reader(lines, delimiter=delimiter))
+    header = [SCHEMA_ALIASES.get(c.strip(), c.strip()) for c in rows[0]] if rows else []
+    body = rows[1:]
+    # Desetinná čárka je možná jen tehdy, když čárka neodděluje sloupce
+    decimal = "."
+    if delimiter != "," and any(DECIMAL_COMMA.fullmatch(v) for row in body for v in row):
+        decimal = ","
+    parse = number_parser(decimal)
+    numeric = frozenset(
+        name for j, name in enumerate(header)
+        if body and all(j < len(row) and (not row[j].strip() or parse(row[j]) is not None) for row in body)
+    )
+    return CsvFormat(delimiter, decimal, header, numeric)
+
+
+def tracked_lines(f, total, progress=None, cancel=None, every=2000):
+    """
+    Prochází řádky otevřeného souboru a průběžně hlásí postup.
+    Args:
+        f: Soubor otevřený v textovém režimu.
+        total (int): Velikost souboru (pro výpočet podílu).
+        progress (callable): Volá se s podílem 0.0–1.0 každých ``every`` řádků.
+        cancel (threading.Event): Pokud je nastaven, vyvolá se Cancelled.
+    Yields:
+        str: Řádky souboru.
+    """
+    if cancel is not None and cancel.is_set():
+        raise Cancelled("Načítání bylo zrušeno.")
+    done = 0
+    for n, line in enumerate(f, 1):
+        done += len(line)
+        if n % every == 0:
+            if cancel is not None and cancel.is_set():
+                raise Cancelled("Načítání bylo zrušeno.")
+            if progress is not None:
+                progress(min(done / total, 1.0) if total else 1.0)
+        yield line
+    if progress is not None:
+        progress(1.0)
+
+
+def load_data(csv_path="world_happiness_2024.csv", delimiter=None, columnar=False, cache=False, cache_dir=None,
+              progress=None, cancel=None):
     """
     Načte data ze souboru CSV a vrátí je jako seznam slovníků.
+    Oddělovač, desetinná čárka a názvy sloupců se zjistí automaticky
+    (viz sniff_format); čísla jsou už při načtení převedena na float.
     Args:
         csv_path (str): Cesta k CSV souboru.
+        delimiter (str): Oddělovač hodnot v souboru, None = zjistit automaticky.
+        columnar (bool): Pokud je True, vrátí sloupcová data (ColumnarData)
+            s čísly jako float a internovanými řetězci.
+        cache (bool): Pokud je True, použije binární cache (viz cache.py).
+        cache_dir (str): Složka pro cache, výchozí vedle CSV souboru.
+        progress (callable): Volá se s podílem načtení 0.0–1.0 (i z jiného vlákna).
+        cancel (threading.Event): Nastavením se načítání přeruší výjimkou Cancelled.
     Returns:
-        List[dict]: Seznam záznamů jako slovníky.
+        List[dict] nebo ColumnarData: Seznam záznamů jako slovníky
+            (IndexedRows – seznam s indexem pro vyhledávání).
     """
     # Vytvoření objektu Path pro zadanou cestu
     path = Path(csv_path)
@@ -20,10 +126,115 @@ def load_data(csv_path="world_happiness_2024.csv", delimiter=';'):
         # Pokud neexistuje, vyvolá výjimku FileNotFoundError
         raise FileNotFoundError(f"Soubor {csv_path} nebyl nalezen.")
 
+    if cache:
+        # Typovaná data z cache (přestaví se, pokud se zdroj změnil)
+        data = load_cached(path, lambda: load_data(path, delimiter, columnar=True, progress=progress, cancel=cancel),
+                           cache_dir)
+        if progress is not None:
+            progress(1.0)
+        return data if columnar else IndexedRows(data.to_dicts())
+
+    # Formát souboru zjistíme jednou z malé ukázky
+    fmt = sniff_format(path)
+
     # Otevření souboru pro čtení s kódováním UTF-8
     with path.open(encoding="utf-8") as f:
-        # Vytvoření DictReader pro čtení CSV jako slovníků
-        reader = csv.DictReader(f, delimiter=delimiter)
-        # Načtení všech řádků do seznamu a uložení do proměnné data
-        data = [row for row in reader]
-    return data
+        lines = tracked_lines(f, path.stat().st_size, progress, cancel)
+        # Vytvoření čtečky CSV; hlavičku nahradíme sjednocenými názvy
+        reader = csv.reader(lines, delimiter=delimiter or fmt.delimiter)
+        next(reader, None)
+        # Typ sloupců se určí z celého souboru, ne jen z ukázky
+        data = ColumnarData.from_rows(fmt.columns, list(reader), parse=number_parser(fmt.decimal))
+    # Slovníky mají stejné typy hodnot jako sloupcová data (i data z cache)
+    return data if columnar else IndexedRows(data.to_dicts())
+
+
+def iter_data(csv_path, delimiter=None, chunk_size=None, fmt=None, progress=None, cancel=None):
+    """
+    Postupně (líně) čte záznamy ze souboru CSV – celý soubor se nikdy
+    nenačte do paměti. Formát se zjišťuje stejně jako v load_data;
+    číselné sloupce se ale určí jen z ukázky, a tak hodnota, kterou nelze
+    převést na číslo, zůstane původním řetězcem.
+    Args:
+        csv_path (str): Cesta k CSV souboru.
+        delimiter (str): Oddělovač hodnot v souboru, None = zjistit automaticky.
+        chunk_size (int): Pokud je zadán, vrací dávky (seznamy) po chunk_size záznamech.
+        fmt (CsvFormat): Již zjištěný formát souboru (jinak se zjistí).
+        progress (callable): Hlášení postupu, viz tracked_lines.
+        cancel (threading.Event): Přerušení čtení, viz tracked_lines.
+    Returns:
+        Iterator[dict] nebo Iterator[list[dict]]: Jednotlivé záznamy, případně
+            jejich dávky. Chybějící soubor se nahlásí hned při volání, ne až
+            při prvním čtení.
+    """
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Soubor {csv_path} nebyl nalezen.")
+    fmt = fmt or sniff_format(path)
+    parse = number_parser(fmt.decimal)
+    columns = fmt.columns
+    # Pozice číselných sloupců, které převedeme na float
+    numeric = [j for j, name in enumerate(columns) if name in fmt.numeric]
+
+    def rows():
+        with path.open(encoding="utf-8") as f:
+            lines = tracked_lines(f, path.stat().st_size, progress, cancel)
+            reader = csv.reader(lines, delimiter=delimiter or fmt.delimiter)
+            next(reader, None)
+            for values in reader:
+                for j in numeric:
+                    # Text hlouběji v souboru, než sahala ukázka, zůstane řetězcem
+                    if j < len(values) and ((number := parse(values[j])) is not None or not values[j].strip()):
+                        values[j] = number
+                yield dict(zip(columns, values))
+
+    def batches():
+        batch = []
+        for row in rows():
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    # Kontrola souboru a zjištění formátu proběhly už teď, čte se až při iteraci
+    return batches() if chunk_size else rows()
+
+
+def find_year_files(directory=None):
+    """
+    Najde všechny roční soubory world_happiness_20XX.csv ve složce.
+    Args:
+        directory (str): Složka s daty, výchozí je složka balíčku happiness.
+    Returns:
+        dict[int, Path]: Cesty k souborům podle roku (seřazené).
+    """
+    directory = Path(directory) if directory else Path(__file__).parent
+    files = {}
+    for path in sorted(directory.glob("world_happiness_*.csv")):
+        if m := YEAR_FILE.fullmatch(path.name):
+            files[int(m.group(1))] = path
+    return files
+
+
+def load_panel(directory=None, max_workers=None, cache=False):
+    """
+    Načte všechny ročníky najednou (souběžně) do jednoho panelu.
+    Args:
+        directory (str): Složka s ročními soubory.
+        max_workers (int): Počet vláken, výchozí podle ThreadPoolExecutor.
+        cache (bool): Použít binární cache pro jednotlivé ročníky.
+    Returns:
+        Panel: Data všech ročníků, řádky lze hledat podle (země, rok).
+    """
+    files = find_year_files(directory)
+    if not files:
+        raise FileNotFoundError(f"Ve složce {directory} nebyly nalezeny žádné roční soubory.")
+
+    def load_year(path):
+        return load_data(path, columnar=True, cache=cache)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        parts = dict(zip(files, pool.map(load_year, files.values())))
+    return Panel.from_parts(parts)
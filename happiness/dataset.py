@@ -0,0 +1,213 @@
+"""Sloupcové (columnar) uložení dat Indexu štěstí."""
+# import array pro úsporné pole čísel typu double
+from array import array
+# Mapping jako základ pro "řádkový pohled", který se chová jako slovník
+from collections.abc import Mapping
+import math
+import sys
+
+
+def number_parser(decimal="."):
+    """
+    Vrátí funkci pro převod textu na float podle desetinného oddělovače.
+    Prázdná nebo nečíselná hodnota se převede na None.
+    Args:
+        decimal (str): Desetinný oddělovač v souboru ("." nebo ",").
+    Returns:
+        callable: Funkce str -> float nebo None.
+    """
+    def parse(value):
+        value = value.strip()
+        if not value:
+            return None
+        if decimal != ".":
+            value = value.replace(decimal, ".")
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return parse
+
+
+def column_values(data, key):
+    """
+    Hodnoty sloupce ``key`` – u sloupcových dat přímo sloupec (bez kopie),
+    u seznamu záznamů (slovníků) přes řádky.
+    """
+    if hasattr(data, "column"):
+        return data.column(key)
+    return [r[key] for r in data]
+
+
+class Row(Mapping):
+    """
+    Lehký pohled na jeden řádek sloupcových dat.
+    Chová se jako slovník jen pro čtení, ale nic nekopíruje –
+    hodnoty čte přímo ze sloupců datové sady.
+    """
+    __slots__ = ("_data", "_i")
+
+    def __init__(self, data, i):
+        self._data = data
+        self._i = i
+
+    def __getitem__(self, key):
+        return self._data.value(key, self._i)
+
+    def __iter__(self):
+        return iter(self._data.columns)
+
+    def __len__(self):
+        return len(self._data.columns)
+
+    def __repr__(self):
+        return f"Row({dict(self)!r})"
+
+
+class ColumnarData:
+    """
+    Datová sada uložená po sloupcích.
+    Číselné sloupce jsou pole ``array('d')`` (chybějící hodnota = NaN),
+    textové sloupce jsou seznamy internovaných řetězců.
+    Indexováním nebo iterací získáme řádky jako objekty ``Row``.
+    """
+
+    def __init__(self, columns, numeric, text):
+        # pořadí sloupců podle hlavičky CSV
+        self.columns = list(columns)
+        # název sloupce -> array('d')
+        self.numeric = numeric
+        # název sloupce -> list[str]
+        self.text = text
+        first = next(iter(numeric.values() or text.values()), ())
+        self._length = len(first)
+        self._lookup = None
+
+    @classmethod
+    def from_rows(cls, columns, rows, parse=None):
+        """
+        Vytvoří sloupcová data ze seznamu řádků (seznamů textových hodnot).
+        Sloupec je číselný, pokud jsou všechny jeho neprázdné hodnoty čísla.
+        Args:
+            columns (list[str]): Názvy sloupců.
+            rows (list[list[str]]): Řádky jako seznamy hodnot.
+            parse (callable): Převod textu na float (nebo None), výchozí number_parser().
+        Returns:
+            ColumnarData: Nová datová sada.
+        """
+        parse = parse or number_parser()
+        numeric, text = {}, {}
+        for j, name in enumerate(columns):
+            raw = [row[j] if j < len(row) else "" for row in rows]
+            values = [parse(v) for v in raw]
+            if all(v is not None or not r.strip() for v, r in zip(values, raw)):
+                numeric[name] = array("d", (math.nan if v is None else v for v in values))
+            else:
+                text[name] = [sys.intern(v) for v in raw]
+        return cls(columns, numeric, text)
+
+    def value(self, key, i):
+        """
+        Vrátí hodnotu sloupce ``key`` v řádku ``i``.
+        Chybějící číselná hodnota (NaN) se vrací jako None.
+        """
+        col = self.numeric.get(key)
+        if col is not None:
+            v = col[i]
+            return None if v != v else v
+        return self.text[key][i]
+
+    def column(self, key):
+        """Vrátí celý sloupec (array('d') nebo list[str])."""
+        col = self.numeric.get(key)
+        return col if col is not None else self.text[key]
+
+    @property
+    def lookup(self):
+        """Index pro vyhledávání (DatasetIndex), vytvoří se při prvním použití."""
+        if self._lookup is None:
+            from .index import DatasetIndex
+            self._lookup = DatasetIndex(self)
+        return self._lookup
+
+    def to_dicts(self):
+        """Převede data na seznam obyčejných slovníků."""
+        return [dict(row) for row in self]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [Row(self, k) for k in range(*i.indices(self._length))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("index řádku mimo rozsah")
+        return Row(self, i)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield Row(self, i)
+
+
+class Panel(ColumnarData):
+    """
+    Víceročníková (panelová) data spojená z více ročníků.
+    Má navíc sloupec ``Year`` a řádky lze hledat podle klíče (země, rok).
+    """
+
+    def __init__(self, columns, numeric, text, country_key="Country"):
+        super().__init__(columns, numeric, text)
+        countries = self.text[country_key]
+        years = self.numeric["Year"]
+        # slovník (země, rok) -> pozice řádku
+        self.keys = {(countries[i], int(years[i])): i for i in range(len(self))}
+
+    @classmethod
+    def from_parts(cls, parts):
+        """
+        Spojí data jednotlivých ročníků do jednoho panelu.
+        Args:
+            parts (dict[int, ColumnarData]): Data podle roku.
+        Returns:
+            Panel: Spojená data se sloupcem ``Year``.
+        """
+        columns = []
+        for part in parts.values():
+            columns += [c for c in part.columns if c not in columns]
+        numeric, text = {}, {}
+        for name in columns:
+            # sloupec zůstane číselný, jen pokud je číselný ve všech ročnících
+            if all(name in p.numeric or name not in p.columns for p in parts.values()):
+                col = array("d")
+                for p in parts.values():
+                    col.extend(p.numeric.get(name) or array("d", [math.nan]) * len(p))
+                numeric[name] = col
+            else:
+                col = []
+                for p in parts.values():
+                    if name in p.text:
+                        col += p.text[name]
+                    elif name in p.numeric:
+                        col += ["" if v != v else repr(v) for v in p.numeric[name]]
+                    else:
+                        col += [""] * len(p)
+                text[name] = col
+        numeric["Year"] = array("d", (year for year, p in parts.items() for _ in range(len(p))))
+        return cls(columns + ["Year"], numeric, text)
+
+    def get(self, country, year, default=None):
+        """Vrátí řádek pro danou zemi a rok, nebo ``default``."""
+        i = self.keys.get((country, year))
+        return default if i is None else Row(self, i)
+
+    @property
+    def years(self):
+        """Seřazený seznam let obsažených v panelu."""
+        return sorted({year for _, year in self.keys})
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return Row(self, self.keys[key])
+        return super().__getitem__(key)
@@ -0,0 +1,174 @@
+"""Proudový export záznamů do souborů (NDJSON, JSON, CSV, sloupcový binární formát).
+
+Záznamy se zapisují postupně po dávkách, takže paměť nezávisí na počtu
+řádků a export může běžet ve vlákně na pozadí (viz BackgroundTask).
+Přípona ``.gz`` zapne kompresi gzip.
+"""
+import csv
+import gzip
+import json
+import math
+import struct
+from array import array
+from itertools import islice
+from pathlib import Path
+from .data_loader import Cancelled
+
+# Formáty podle přípony souboru
+FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".json": "json", ".csv": "csv", ".hcol": "columnar"}
+# Sloupcový formát: hlavička souboru a délka hlavičky dávky
+COLUMNAR_MAGIC = b"HCOL1\n"
+LENGTH = struct.Struct("<I")
+
+
+def detect_format(path):
+    """Zjistí formát a kompresi podle přípony (např. data.ndjson.gz)."""
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    compress = bool(suffixes) and suffixes[-1] == ".gz"
+    if compress:
+        suffixes = suffixes[:-1]
+    fmt = FORMATS.get(suffixes[-1] if suffixes else "")
+    if fmt is None:
+        raise ValueError(f"Neznámý formát exportu: {Path(path).name}")
+    return fmt, compress
+
+
+def _open(path, binary, compress):
+    """Otevře výstupní soubor (případně komprimovaný gzip)."""
+    if compress:
+        return gzip.open(path, "wb" if binary else "wt", encoding=None if binary else "utf-8",
+                         newline=None if binary else "")
+    if binary:
+        return open(path, "wb")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _batches(rows, size):
+    """Rozdělí proud záznamů na dávky (seznamy) po ``size``."""
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _write_text(f, fmt, batch, columns, state):
+    """Zapíše jednu dávku v textovém formátu."""
+    if fmt == "ndjson":
+        f.writelines(json.dumps(dict(r), ensure_ascii=False) + "\n" for r in batch)
+    elif fmt == "json":
+        for r in batch:
+            f.write(("[\n" if state["first"] else ",\n") + json.dumps(dict(r), ensure_ascii=False))
+            state["first"] = False
+    else:
+        if state["writer"] is None:
+            state["writer"] = csv.writer(f)
+            state["writer"].writerow(columns)
+        state["writer"].writerows([["" if r.get(c) is None else r.get(c) for c in columns] for r in batch])
+
+
+def _write_columnar(f, batch, columns):
+    """
+    Zapíše jednu dávku (row group) ve sloupcovém formátu:
+    délka + JSON hlavička dávky, pak data sloupců za sebou.
+    Číselné sloupce jsou pole double (NaN = chybí), textové jsou
+    posuny (uint32) + UTF-8 bajty.
+    """
+    blobs, meta = [], []
+    for c in columns:
+        values = [r.get(c) for r in batch]
+        if all(v is None or isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            blobs.append(array("d", (math.nan if v is None else v for v in values)).tobytes())
+            meta.append([c, "d"])
+        else:
+            encoded = [("" if v is None else str(v)).encode("utf-8") for v in values]
+            offsets = array("I", [0])
+            for e in encoded:
+                offsets.append(offsets[-1] + len(e))
+            blobs.append(offsets.tobytes() + b"".join(encoded))
+            meta.append([c, "s"])
+    header = json.dumps({"rows": len(batch), "columns": meta,
+                         "sizes": [len(b) for b in blobs]}).encode("utf-8")
+    f.write(LENGTH.pack(len(header)))
+    f.write(header)
+    for blob in blobs:
+        f.write(blob)
+
+
+def export_rows(rows, path, fmt=None, compress=None, columns=None, batch_size=4096,
+                progress=None, cancel=None):
+    """
+    Postupně zapíše záznamy do souboru.
+    Args:
+        rows (iterable): Záznamy (slovníky nebo řádky ColumnarData), i generátor.
+        path (str): Cílový soubor.
+        fmt (str): 'ndjson', 'json', 'csv' nebo 'columnar'; None = podle přípony.
+        compress (bool): Komprese gzip; None = podle přípony .gz.
+        columns (list[str]): Sloupce pro CSV/columnar; None = podle prvního záznamu.
+        batch_size (int): Počet záznamů v jedné dávce.
+        progress (callable): Volá se s podílem 0.0–1.0 (jen pokud je znám počet záznamů).
+        cancel (threading.Event): Nastavením se export přeruší (Cancelled),
+            rozepsaný soubor se smaže.
+    Returns:
+        int: Počet zapsaných záznamů.
+    """
+    detected = detect_format(path) if fmt is None or compress is None else (fmt, compress)
+    fmt = fmt or detected[0]
+    compress = detected[1] if compress is None else compress
+    total = len(rows) if hasattr(rows, "__len__") else None
+    binary = fmt == "columnar"
+    written = 0
+    state = {"first": True, "writer": None}
+    try:
+        with _open(path, binary, compress) as f:
+            if binary:
+                f.write(COLUMNAR_MAGIC)
+            for batch in _batches(rows, batch_size):
+                if cancel is not None and cancel.is_set():
+                    raise Cancelled("Export byl zrušen.")
+                if columns is None:
+                    columns = list(batch[0])
+                if binary:
+                    _write_columnar(f, batch, columns)
+                else:
+                    _write_text(f, fmt, batch, columns, state)
+                written += len(batch)
+                if progress is not None and total:
+                    progress(written / total)
+            if fmt == "json":
+                f.write("[]\n" if state["first"] else "\n]\n")
+            elif fmt == "csv" and state["writer"] is None and columns:
+                csv.writer(f).writerow(columns)
+    except BaseException:
+        Path(path).unlink(missing_ok=True)
+        raise
+    if progress is not None:
+        progress(1.0)
+    return written
+
+
+def read_columnar(path):
+    """
+    Postupně čte soubor ve sloupcovém formátu (po dávkách).
+    Yields:
+        dict: Jednotlivé záznamy.
+    """
+    opener = gzip.open if Path(path).suffix.lower() == ".gz" else open
+    with opener(path, "rb") as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Soubor {path} není ve sloupcovém formátu.")
+        while head := f.read(LENGTH.size):
+            meta = json.loads(f.read(LENGTH.unpack(head)[0]))
+            n = meta["rows"]
+            columns = {}
+            for (name, kind), size in zip(meta["columns"], meta["sizes"]):
+                blob = f.read(size)
+                if kind == "d":
+                    values = array("d")
+                    values.frombytes(blob)
+                    columns[name] = [None if v != v else v for v in values]
+                else:
+                    offsets = array("I")
+                    offsets.frombytes(blob[:(n + 1) * 4])
+                    data = blob[(n + 1) * 4:]
+                    columns[name] = [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n)]
+            for i in range(n):
+                yield {name: values[i] for name, values in columns.items()}
@@ -1,4 +1,11 @@
-"""Modul pro filtrování dat ze souboru Indexu štěstí."""
+"""Modul pro filtrování dat ze souboru Indexu štěstí.
+
+Funkce přijímají seznam záznamů i libovolný iterátor (např. z iter_data).
+Pro seznam vrací seznam, pro iterátor vrací generátor – filtry tak lze
+řetězit do proudového zpracování s konstantní pamětí.
+Pokud data mají index ``lookup`` (IndexedRows, ColumnarData), použije se
+místo procházení všech záznamů.
+"""
 
 
 def to_float(x):
@@ -9,6 +16,9 @@ def to_float(x):
     Returns:
         float nebo None: Převedená hodnota nebo None při chybě.
     """
+    # Data z load_data už jsou převedená na čísla – rychlá cesta bez výjimek
+    if isinstance(x, float):
+        return x
     # Použití výjimky pro bezpečné převedení na float
     # Pokusit se převést x na float
     try:
@@ -25,40 +35,60 @@ def to_float(x):
             return None
 
 
+def _result(data, matches):
+    """Vrátí seznam pro seznam (sekvenci) a generátor pro proud dat."""
+    # Iterátor (generátor, soubor…) vrací z iter() sám sebe
+    if iter(data) is data:
+        return matches
+    return list(matches)
+
+
 def find_country(data, name):
     """
     Vyhledá zemi podle názvu (case-insensitive).
     Args:
-        data (list): Seznam záznamů jako slovníky.
+        data (list nebo iterable): Seznam záznamů jako slovníky.
         name (str): Název země k vyhledání.
     Returns:
-        list: Seznam záznamů odpovídajících názvu země.
+        list nebo generátor: Seznam záznamů odpovídajících názvu země.
     """
-    return [r for r in data if name.lower() in r["Country"].lower()]
+    lookup = getattr(data, "lookup", None)
+    if lookup is not None:
+        return [data[i] for i in lookup.country_like(name)]
+    name = name.casefold()
+    return _result(data, (r for r in data if name in r["Country"].casefold()))
 
 
 def filter_by_region(data, region):
     """
     Vrátí všechny země v daném regionu.
     Args:
-        data (list): Seznam záznamů jako slovníky.
+        data (list nebo iterable): Seznam záznamů jako slovníky.
         region (str): Název regionu.
     Returns:
-        list: Seznam záznamů v daném regionu.
+        list nebo generátor: Seznam záznamů v daném regionu.
     """
-    return [r for r in data if r["Regional indicator"] == region]
+    lookup = getattr(data, "lookup", None)
+    if lookup is not None:
+        return [data[i] for i in lookup.region(region)]
+    return _result(data, (r for r in data if r["Regional indicator"] == region))
 
 
 def filter_by_score_range(data, min_score, max_score, score_key="Happiness score"):
     """
-    Filtr podle hodnoty štěstí.
+    Filtr podle hodnoty štěstí (nebo jiného číselného sloupce).
     Args:
-        data (list): Seznam záznamů jako slovníky.
+        data (list nebo iterable): Seznam záznamů jako slovníky.
         min_score (float): Minimální hodnota skóre.
         max_score (float): Maximální hodnota skóre.
+        score_key (str): Název číselného sloupce.
     Returns:
-        list: Seznam záznamů s hodnotou skóre v zadaném rozsahu.
+        list nebo generátor: Seznam záznamů s hodnotou skóre v zadaném rozsahu.
     """
-    return [r for r in data if (v := to_float(r[score_key])) and min_score <= v <= max_score]
+    lookup = getattr(data, "lookup", None)
+    if lookup is not None:
+        return [data[i] for i in lookup.score_range(score_key, min_score, max_score)]
+    # Pozor: hodnota 0.0 je platné skóre, proto porovnání s None (ne pravdivost)
+    return _result(data, (r for r in data if (v := to_float(r[score_key])) is not None and min_score <= v <= max_score))
 
 
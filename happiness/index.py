@@ -0,0 +1,129 @@
+"""Indexy pro rychlé vyhledávání v datech Indexu štěstí."""
+from bisect import bisect_left, bisect_right
+from .dataset import column_values
+from .filters import to_float
+
+
+def _trigrams(text):
+    """Množina všech trojic znaků (n-gramů) v textu."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class DatasetIndex:
+    """
+    Index nad jednou datovou sadou, postavený jednou při prvním použití.
+    - hashovací index regionů: region -> pozice řádků,
+    - slovník přesných názvů zemí: název -> pozice řádků,
+    - n-gramový (trigramový) index na názvech zemí pro hledání podřetězců
+      bez ohledu na velikost písmen.
+    - seřazené číselné indexy (SortedColumn) pro libovolný sloupec,
+      vytvářené až při prvním rozsahovém dotazu na daný sloupec.
+    Všechny dotazy vrací pozice řádků seřazené podle pořadí v datech.
+    """
+
+    def __init__(self, data, country_key="Country", region_key="Regional indicator"):
+        self._data = data
+        self._sorted = {}
+        self.by_region = {}
+        for i, region in enumerate(column_values(data, region_key)):
+            self.by_region.setdefault(region, []).append(i)
+
+        self.by_name = {}
+        for i, name in enumerate(column_values(data, country_key)):
+            self.by_name.setdefault(name, []).append(i)
+
+        # Názvy zemí převedené na malá písmena (casefold) a jejich trigramy
+        self.folded = {name: name.casefold() for name in self.by_name}
+        self.ngrams = {}
+        for name, folded in self.folded.items():
+            for gram in _trigrams(folded):
+                self.ngrams.setdefault(gram, set()).add(name)
+
+    def region(self, region):
+        """Pozice řádků v daném regionu."""
+        return self.by_region.get(region, [])
+
+    def country(self, name):
+        """Pozice řádků s přesně zadaným názvem země."""
+        return self.by_name.get(name, [])
+
+    def country_names_like(self, query):
+        """Názvy zemí, které obsahují ``query`` (bez ohledu na velikost písmen)."""
+        query = query.casefold()
+        grams = _trigrams(query)
+        if grams:
+            # Kandidáti musí obsahovat všechny trigramy dotazu
+            candidates = set.intersection(*(self.ngrams.get(g, set()) for g in grams))
+        else:
+            # Krátký dotaz (méně než 3 znaky) – projdeme jen různé názvy zemí
+            candidates = self.folded
+        return [name for name in candidates if query in self.folded[name]]
+
+    def country_like(self, query):
+        """Pozice řádků, jejichž název země obsahuje ``query``."""
+        names = self.country_names_like(query)
+        if len(names) == 1:
+            return self.by_name[names[0]]
+        return sorted(i for name in names for i in self.by_name[name])
+
+    def sorted_column(self, key):
+        """Seřazený index sloupce ``key`` (vytvoří se při prvním použití)."""
+        column = self._sorted.get(key)
+        if column is None:
+            column = self._sorted[key] = SortedColumn(column_values(self._data, key))
+        return column
+
+    def score_range(self, key, min_score, max_score):
+        """
+        Pozice řádků, jejichž hodnota ve sloupci ``key`` je v rozsahu <min, max>.
+        Pozice se kvůli pořadí řádků řadí, dotaz je tedy O(log n + k log k);
+        kdo pořadí řádků nepotřebuje, vezme ``sorted_column(key).between()``
+        (pořadí podle hodnoty, O(log n + k)).
+        """
+        return sorted(self.sorted_column(key).between(min_score, max_score))
+
+
+class SortedColumn:
+    """
+    Hodnoty jednoho číselného sloupce seřazené vzestupně spolu s pozicemi
+    řádků. Rozsahový dotaz jsou dvě binární vyhledávání a výřez – O(log n + k).
+    Chybějící hodnoty (None i NaN ze sloupcových dat) se do indexu nezařadí.
+    """
+
+    def __init__(self, values):
+        pairs = sorted((v, i) for i, value in enumerate(values) if (v := to_float(value)) is not None and v == v)
+        self.values = [v for v, _ in pairs]
+        self.positions = [i for _, i in pairs]
+
+    def bounds(self, min_score, max_score):
+        """Rozsah indexů (od, do) v seřazeném poli pro hodnoty v <min, max>."""
+        return bisect_left(self.values, min_score), bisect_right(self.values, max_score)
+
+    def between(self, min_score, max_score):
+        """Pozice řádků s hodnotou v <min, max> (v pořadí podle hodnoty)."""
+        lo, hi = self.bounds(min_score, max_score)
+        return self.positions[lo:hi]
+
+    def count(self, min_score, max_score):
+        """Počet řádků s hodnotou v <min, max> bez vytváření výsledku."""
+        lo, hi = self.bounds(min_score, max_score)
+        return max(hi - lo, 0)
+
+
+class IndexedRows(list):
+    """
+    Seznam záznamů (slovníků) s líně vytvořeným indexem ``lookup``.
+    Index odpovídá stavu seznamu při prvním dotazu; po změně seznamu
+    je potřeba zavolat ``reindex()``.
+    """
+    _index = None
+
+    @property
+    def lookup(self):
+        if self._index is None:
+            self._index = DatasetIndex(self)
+        return self._index
+
+    def reindex(self):
+        """Zahodí index, při dalším dotazu se postaví znovu."""
+        self._index = None
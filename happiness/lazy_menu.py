@@ -0,0 +1,89 @@
+"""Menu Happiness bez importu implementace.
+
+Položky menu se zaregistrují hned, ale moduly s daty a dialogy
+(happiness.ui_menu a vše, co importuje) se načtou až při prvním kliknutí.
+Chyba importu se nahlásí oknem se zprávou, menu přitom zůstane.
+"""
+import importlib
+import sys
+import time
+import traceback
+import tkinter as tk
+from tkinter import messagebox
+
+# Modul s implementací menu (HappinessApp)
+IMPLEMENTATION = "happiness.ui_menu"
+# Položky menu: (popisek, metoda HappinessApp); None = oddělovač
+MENU_ITEMS = [
+    ("Načíst data…", "choose_file"),
+    None,
+    ("Zobrazit tabulku", "show_table"),
+    ("Hledat zemi", "search_country"),
+    ("Filtrovat podle regionu", "filter_region"),
+    ("Filtrovat podle indexu štěstí", "filter_score_range"),
+    None,
+    ("Exportovat…", "export_data"),
+]
+# Doba importu (s) líně načtených modulů – pro zprávu o startu
+IMPORT_TIMES = {}
+
+
+def timed_import(name):
+    """Naimportuje modul a zapamatuje si, jak dlouho import trval."""
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMES[name] = time.perf_counter() - start
+    return module
+
+
+class LazyHappinessMenu:
+    """Drží menu a při prvním použití vytvoří HappinessApp z modulu IMPLEMENTATION."""
+
+    def __init__(self, root, menu):
+        self.root = root
+        self.menu = menu
+        self.app = None
+
+    def load(self):
+        """
+        Načte implementaci menu (jen poprvé).
+        Returns:
+            HappinessApp nebo None, pokud se import nezdařil.
+        """
+        if self.app is None:
+            try:
+                module = timed_import(IMPLEMENTATION)
+            except Exception as e:
+                traceback.print_exc()
+                messagebox.showerror("Chyba", f"Menu Happiness nelze načíst:\n{type(e).__name__}: {e}",
+                                     parent=self.root)
+                return None
+            self.app = module.HappinessApp(self.root)
+            self.app.menu = self.menu
+        return self.app
+
+    def invoke(self, method):
+        """Zavolá metodu HappinessApp (implementace se případně nejdřív načte)."""
+        app = self.load()
+        if app is not None:
+            getattr(app, method)()
+
+
+def attach_lazy_menu(root, menubar):
+    """
+    Přidá menu Happiness do ``menubar``, aniž by načítalo data nebo dialogy.
+    Returns:
+        LazyHappinessMenu: Po prvním použití má v atributu ``app`` HappinessApp.
+    """
+    m = tk.Menu(menubar, tearoff=False)
+    lazy = LazyHappinessMenu(root, m)
+    for item in MENU_ITEMS:
+        if item is None:
+            m.add_separator()
+        else:
+            label, method = item
+            m.add_command(label=label, command=lambda method=method: lazy.invoke(method))
+    menubar.add_cascade(label="Happiness", menu=m)
+    return lazy
@@ -0,0 +1,146 @@
+"""Skládání dotazů nad daty Indexu štěstí.
+
+Příklad::
+
+    Query(data).region("Western Europe").score_between(7, 8).order_by("Happiness score", descending=True).limit(5).all()
+
+Dotaz si vybere nejselektivnější dostupný index (region, název země,
+rozsah skóre), zbylé podmínky vyhodnotí v jediném průchodu kandidáty
+a nevytváří žádné mezivýsledky.
+"""
+import heapq
+from itertools import islice
+from .filters import to_float
+
+
+class Query:
+    """Skladatel dotazů; metody vrací stejný objekt, aby šly řetězit."""
+
+    def __init__(self, data, country_key="Country", region_key="Regional indicator"):
+        self._data = data
+        self._country_key = country_key
+        self._region_key = region_key
+        self._region = None
+        self._country = None
+        self._ranges = []
+        self._predicates = []
+        self._order = None
+        self._limit = None
+
+    # ----------------- Podmínky -----------------
+    def region(self, region):
+        """Jen záznamy z daného regionu."""
+        self._region = region
+        return self
+
+    def country_like(self, name):
+        """Jen země, jejichž název obsahuje ``name`` (bez ohledu na velikost písmen)."""
+        self._country = name.casefold()
+        return self
+
+    def score_between(self, min_score, max_score, score_key="Happiness score"):
+        """Jen záznamy s hodnotou sloupce ``score_key`` v rozsahu <min, max>."""
+        self._ranges.append((score_key, min_score, max_score))
+        return self
+
+    def where(self, predicate):
+        """Vlastní podmínka – funkce, která pro záznam vrátí True/False."""
+        self._predicates.append(predicate)
+        return self
+
+    # ----------------- Řazení a omezení -----------------
+    def order_by(self, key, descending=False):
+        """Seřadí výsledek podle sloupce (chybějící hodnoty jsou vždy na konci)."""
+        self._order = (key, descending)
+        return self
+
+    def limit(self, n):
+        """Vrátí nejvýše ``n`` záznamů."""
+        self._limit = n
+        return self
+
+    # ----------------- Vyhodnocení -----------------
+    def plan(self):
+        """
+        Vybere index, ze kterého se vezmou kandidáti.
+        Returns:
+            tuple: (popis, odhad počtu kandidátů, funkce vracející pozice)
+                nebo None, pokud data index nemají nebo dotaz nemá podmínku.
+        """
+        lookup = getattr(self._data, "lookup", None)
+        if lookup is None:
+            return None
+        options = []
+        if self._region is not None:
+            positions = lookup.region(self._region)
+            options.append(("region", len(positions), lambda: positions))
+        if self._country is not None:
+            names = lookup.country_names_like(self._country)
+            estimate = sum(len(lookup.country(name)) for name in names)
+            options.append(("country", estimate, lambda: lookup.country_like(self._country)))
+        for key, low, high in self._ranges:
+            column = lookup.sorted_column(key)
+            # Výsledek se pak řadí podle téhož sloupce – stačí pořadí podle hodnoty
+            # (O(log n + k), shody zůstávají v pořadí řádků), jinak se pozice seřadí
+            by_value = self._order is not None and self._order[0] == key
+            options.append((f"score:{key}", column.count(low, high),
+                            lambda c=column, lo=low, hi=high, keep=by_value:
+                            c.between(lo, hi) if keep else sorted(c.between(lo, hi))))
+        return min(options, key=lambda o: o[1], default=None)
+
+    def _matches(self, skip):
+        """Složí všechny podmínky kromě ``skip`` do jedné funkce."""
+        checks = []
+        if self._region is not None and skip != "region":
+            checks.append(lambda r, k=self._region_key, region=self._region: r[k] == region)
+        if self._country is not None and skip != "country":
+            checks.append(lambda r, k=self._country_key, name=self._country: name in r[k].casefold())
+        for key, low, high in self._ranges:
+            if skip != f"score:{key}":
+                checks.append(lambda r, k=key, lo=low, hi=high:
+                              (v := to_float(r[k])) is not None and lo <= v <= hi)
+        checks += self._predicates
+        return lambda r: all(check(r) for check in checks)
+
+    def __iter__(self):
+        plan = self.plan()
+        if plan is None:
+            rows, skip = iter(self._data), None
+        else:
+            skip, _, positions = plan
+            data = self._data
+            rows = (data[i] for i in positions())
+        match = self._matches(skip)
+        # Jediný průchod kandidáty – bez mezivýsledků
+        result = (r for r in rows if match(r))
+
+        if self._order is not None:
+            key, descending = self._order
+
+            def sort_key(r):
+                v = r[key]
+                # textová čísla (data bez normalizace) řadíme jako čísla
+                if isinstance(v, str) and (number := to_float(v)) is not None:
+                    v = number
+                # chybějící hodnoty řadíme na konec v obou směrech
+                return (v is not None, v) if descending else (v is None, v)
+
+            if self._limit is not None:
+                pick = heapq.nlargest if descending else heapq.nsmallest
+                return iter(pick(self._limit, result, key=sort_key))
+            return iter(sorted(result, key=sort_key, reverse=descending))
+        if self._limit is not None:
+            return islice(result, self._limit)
+        return result
+
+    def all(self):
+        """Vrátí výsledek jako seznam."""
+        return list(self)
+
+    def first(self):
+        """Vrátí první záznam výsledku, nebo None."""
+        return next(iter(self), None)
+
+    def count(self):
+        """Počet záznamů ve výsledku."""
+        return sum(1 for _ in self)
@@ -1,8 +1,74 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog, ttk
-import json
+from pathlib import Path
+from .background import BackgroundTask
 from .data_loader import load_data
+from .export import detect_format, export_rows
 from .filters import find_country, filter_by_region, filter_by_score_range
+from .lazy_menu import MENU_ITEMS
+from .virtual_table import VirtualTable
+
+# Výchozí soubor s daty (nejnovější ročník v balíčku)
+DEFAULT_CSV = Path(__file__).with_name("world_happiness_2024.csv")
+# Typy souborů nabízené při exportu
+EXPORT_TYPES = [
+    ("NDJSON", "*.ndjson"), ("JSON", "*.json"), ("CSV", "*.csv"), ("Sloupcový binární formát", "*.hcol"),
+    ("Komprimované gzip", "*.gz"),
+]
+# Prodleva (ms) po posledním stisku klávesy, než se spustí hledání
+DEBOUNCE_MS = 40
+# Položky menu, které potřebují načtená data
+DATA_ITEMS = ["Zobrazit tabulku", "Hledat zemi", "Filtrovat podle regionu", "Filtrovat podle indexu štěstí"]
+
+
+class LiveSearch:
+    """
+    Průběžné hledání země při psaní do pole.
+    Stisky kláves se sloučí (debounce); pokud nový dotaz jen prodlužuje
+    předchozí, prohledá se jen předchozí výsledek, ne celá data.
+    Výsledek se předá funkci ``on_result`` (např. VirtualTable.set_rows).
+    """
+
+    def __init__(self, widget, variable, get_data, on_result, key="Country"):
+        self.widget = widget
+        self.variable = variable
+        self.get_data = get_data
+        self.on_result = on_result
+        self.key = key
+        self._query = ""
+        self._result = None
+        self._after = None
+        variable.trace_add("write", self._schedule)
+
+    def reset(self):
+        """Zapomene předchozí výsledek (např. po načtení nových dat)."""
+        self._query, self._result = "", None
+
+    def clear(self):
+        """Vymaže dotaz a hned (bez prodlevy) předá ``on_result`` všechna data."""
+        self.reset()
+        self.variable.set("")
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+        self._run()
+
+    def _schedule(self, *args):
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+        self._after = self.widget.after(DEBOUNCE_MS, self._run)
+
+    def _run(self):
+        self._after = None
+        query = self.variable.get().strip().casefold()
+        if not query:
+            result = self.get_data()
+        elif self._result is not None and self._query and query.startswith(self._query):
+            # Dotaz se jen prodloužil – stačí zúžit předchozí výsledek
+            result = [r for r in self._result if query in r[self.key].casefold()]
+        else:
+            result = find_country(self.get_data(), query)
+        self._query, self._result = query, (result if query else None)
+        self.on_result(result)
 
 
 class HappinessApp:
@@ -10,55 +76,121 @@ class HappinessApp:
         self.root = root
         self.data = []
         self.filtered = []
-        self.tree = None
-
-    def ensure_loaded(self):
-        if not self.data:
-            try:
-                self.data = load_data()
-            except FileNotFoundError:
-                path = filedialog.askopenfilename(title="Vyber CSV soubor s daty štěstí", filetypes=[("CSV","*.csv")])
+        self.table = None
+        self.table_window = None
+        self.search_var = None
+        self.search_entry = None
+        self.search = None
+        self.menu = None
+        self._loading = None
+
+    def ensure_loaded(self, then=None):
+        """
+        Vrátí True, pokud jsou data načtená. Jinak spustí načítání na pozadí
+        a po jeho dokončení zavolá ``then`` (např. metodu, která data chtěla).
+        """
+        if self.data:
+            return True
+        self.load(then=then)
+        return False
+
+    def load(self, path=None, then=None):
+        """Načte data ve vlákně na pozadí; UI mezitím normálně reaguje."""
+        if self._loading is not None:
+            return
+        if path is None:
+            path = DEFAULT_CSV
+            if not path.exists():
+                path = filedialog.askopenfilename(title="Vyber CSV soubor s daty štěstí", filetypes=[("CSV", "*.csv")])
                 if not path:
-                    return False
-                self.data = load_data(path)
-            print(f"Načteno {self.data} záznamů.")
-        return True
+                    return
+        self._set_ready(False)
+
+        def done(data):
+            self._loading = None
+            self.data = data
+            self.filtered = []
+            if self.table_window is not None and self.table_window.winfo_exists():
+                self.search.clear()
+            print(f"Načteno {len(data)} záznamů.")
+            self._set_ready(True)
+            if then is not None:
+                then()
+
+        def failed(error):
+            self._loading = None
+            self._set_ready(bool(self.data))
+            messagebox.showerror("Chyba", f"Data se nepodařilo načíst:\n{error}")
+
+        def cancelled():
+            self._loading = None
+            self._set_ready(bool(self.data))
+
+        self._loading = BackgroundTask(
+            self.root, "Načítání dat",
+            lambda progress, cancel: load_data(path, columnar=True, cache=True, progress=progress, cancel=cancel),
+            on_done=done, on_error=failed, on_cancel=cancelled,
+        )
+
+    def choose_file(self):
+        """Zeptá se na CSV soubor a načte ho místo současných dat."""
+        path = filedialog.askopenfilename(title="Vyber CSV soubor s daty štěstí", filetypes=[("CSV", "*.csv")])
+        if path:
+            self.load(path)
+
+    def _set_ready(self, ready):
+        """Povolí/zakáže položky menu, které potřebují data."""
+        if self.menu is None:
+            return
+        for label in DATA_ITEMS:
+            self.menu.entryconfigure(label, state="normal" if ready else "disabled")
 
     def show_table(self):
-        if not self.ensure_loaded():
+        if not self.ensure_loaded(then=self.show_table):
             return
-        win = tk.Toplevel(self.root)
+        # Okno s tabulkou je jen jedno – při dalším otevření ho přeneseme dopředu
+        if self.table_window is not None and self.table_window.winfo_exists():
+            # Prázdný dotaz přes LiveSearch – tabulka, počet záznamů i self.filtered najednou
+            self.search.clear()
+            self.table_window.lift()
+            return
+        win = self.table_window = tk.Toplevel(self.root)
         win.title("Tabulka Indexu štěstí")
-        cols = ["Country", "Regional indicator", "Ladder score", "Healthy life expectancy", "GDP per capita"]
-        self.tree = ttk.Treeview(win, columns=cols, show="headings")
-        print(f"Zobrazování {len(self.data)} záznamů.")
-        print(f"Sloupce: {cols}")
-        print(f"První záznam: {self.data[0]}")
-        for col in cols:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=180)
-        for row in self.data:
-            values = [row.get(c, "") for c in cols]
-            self.tree.insert("", "end", values=values)
-        self.tree.pack(fill="both", expand=True)
+
+        # Pole pro průběžné hledání nad tabulkou
+        bar = ttk.Frame(win, padding=(6, 6, 6, 0))
+        bar.pack(fill="x")
+        ttk.Label(bar, text="Hledat zemi:").pack(side="left")
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(bar, textvariable=self.search_var, width=32)
+        self.search_entry.pack(side="left", padx=6)
+        count = ttk.Label(bar, text=f"{len(self.data)} záznamů")
+        count.pack(side="right")
+
+        cols = ["Country", "Regional indicator", "Happiness score", "Healthy life expectancy", "GDP per capita"]
+        # Virtualizovaná tabulka – položky jen pro viditelné řádky
+        self.table = VirtualTable(win, cols, self.data)
+        self.table.pack(fill="both", expand=True)
         self.filtered = self.data
 
+        def show(result):
+            # Tabulka se jen přepíše na místě, položky se nevytváří znovu
+            self.table.set_rows(result)
+            self.filtered = result
+            count.config(text=f"{len(result)} záznamů")
+
+        self.search = LiveSearch(win, self.search_var, lambda: self.data, show)
+
     def search_country(self):
-        if not self.ensure_loaded():
+        """Otevře tabulku a přesune kurzor do pole pro průběžné hledání."""
+        if not self.ensure_loaded(then=self.search_country):
             return
-        name = simpledialog.askstring("Hledat", "Zadej název země:")
-        if not name:
-            return
-        result = find_country(self.data, name)
-        if not result:
-            messagebox.showinfo("Výsledek", "Země nebyla nalezena.")
-        else:
-            txt = "\n".join(f"{r['Country name']} — {r['Ladder score']}" for r in result)
-            messagebox.showinfo("Výsledek", txt)
-            self.filtered = result
+        self.show_table()
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, "end")
 
     def filter_region(self):
-        if not self.ensure_loaded():
+        if not self.ensure_loaded(then=self.filter_region):
             return
         region = simpledialog.askstring("Filtr", "Zadej název regionu (např. Western Europe):")
         if not region:
@@ -67,12 +199,12 @@ class HappinessApp:
         if not result:
             messagebox.showinfo("Výsledek", "Žádná země v daném regionu.")
         else:
-            txt = "\n".join(f"{r['Country name']} — {r['Ladder score']}" for r in result)
+            txt = "\n".join(f"{r['Country']} — {r['Happiness score']}" for r in result)
             messagebox.showinfo("Výsledek", txt)
             self.filtered = result
 
     def filter_score_range(self):
-        if not self.ensure_loaded():
+        if not self.ensure_loaded(then=self.filter_score_range):
             return
         min_val = simpledialog.askfloat("Filtr", "Minimální hodnota štěstí:", minvalue=0, maxvalue=10)
         max_val = simpledialog.askfloat("Filtr", "Maximální hodnota štěstí:", minvalue=0, maxvalue=10)
@@ -82,25 +214,42 @@ class HappinessApp:
         messagebox.showinfo("Výsledek", f"Nalezeno {len(result)} zemí.")
         self.filtered = result
 
-    def export_json(self):
+    def export_data(self):
+        """Export vyfiltrovaných dat na pozadí (NDJSON, JSON, CSV, sloupcový formát, volitelně .gz)."""
         if not self.filtered:
             messagebox.showinfo("Info", "Nejprve vyhledej nebo filtruj data.")
             return
-        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON","*.json")])
+        path = filedialog.asksaveasfilename(defaultextension=".ndjson", filetypes=EXPORT_TYPES)
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.filtered, f, ensure_ascii=False, indent=2)
-        messagebox.showinfo("Hotovo", f"Soubor uložen: {path}")
+        try:
+            detect_format(path)
+        except ValueError as e:
+            messagebox.showerror("Chyba", str(e))
+            return
+        rows = self.filtered
+        BackgroundTask(
+            self.root, "Export dat",
+            lambda progress, cancel: export_rows(rows, path, progress=progress, cancel=cancel),
+            on_done=lambda n: messagebox.showinfo("Hotovo", f"Uloženo {n} záznamů: {path}"),
+            on_error=lambda e: messagebox.showerror("Chyba", f"Export se nezdařil:\n{e}"),
+        )
+
 
 def attach_happiness_menu(root, menubar):
+    """Přidá menu Happiness a hned začne načítat výchozí data (viz lazy_menu pro líné načtení)."""
     app = HappinessApp(root)
     m = tk.Menu(menubar, tearoff=False)
-    m.add_command(label="Zobrazit tabulku", command=app.show_table)
-    m.add_command(label="Hledat zemi", command=app.search_country)
-    m.add_command(label="Filtrovat podle regionu", command=app.filter_region)
-    m.add_command(label="Filtrovat podle indexu štěstí", command=app.filter_score_range)
-    m.add_separator()
-    m.add_command(label="Exportovat do JSON", command=app.export_json)
+    for item in MENU_ITEMS:
+        if item is None:
+            m.add_separator()
+        else:
+            label, method = item
+            m.add_command(label=label, command=getattr(app, method))
     menubar.add_cascade(label="Happiness", menu=m)
+    app.menu = m
+    # Výchozí data se začnou načítat na pozadí hned po spuštění
+    app._set_ready(False)
+    if DEFAULT_CSV.exists():
+        root.after_idle(app.load)
     return app
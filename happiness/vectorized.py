@@ -0,0 +1,160 @@
+"""Vektorizované filtry a souhrny nad daty Indexu štěstí (volitelně s NumPy).
+
+Pokud je nainstalovaný NumPy, číselné sloupce se zpracují jako pole
+(rozsahové filtry jako booleovské masky, souhrny po skupinách bez cyklu
+přes řádky). Bez NumPy se automaticky použije čistý Python se stejnými
+výsledky (u průměru a směrodatné odchylky až na zaokrouhlení floatů).
+"""
+import math
+import statistics
+from . import filters
+from .dataset import column_values
+
+try:
+    import numpy as np
+except ImportError:  # NumPy je volitelná závislost
+    np = None
+
+# Je k dispozici NumPy backend?
+HAS_NUMPY = np is not None
+# Podporované souhrnné statistiky
+STATS = ("count", "mean", "median", "std", "min", "max")
+
+
+def _backend(backend):
+    """Vybere backend: 'numpy', 'python' nebo None = NumPy, pokud je k dispozici."""
+    if backend is None:
+        return "numpy" if HAS_NUMPY else "python"
+    if backend == "numpy" and not HAS_NUMPY:
+        raise ImportError("Backend 'numpy' vyžaduje nainstalovaný balíček numpy.")
+    if backend not in ("numpy", "python"):
+        raise ValueError(f"Neznámý backend: {backend}")
+    return backend
+
+
+def _float_values(data, key):
+    """Číselný sloupec jako seznam floatů (chybějící hodnota = None)."""
+    return [filters.to_float(v) for v in column_values(data, key)]
+
+
+def numeric_array(data, key):
+    """
+    Vrátí číselný sloupec jako pole NumPy float64 (chybějící hodnota = NaN).
+    U sloupcových dat (array('d') nebo memoryview z cache) se nic nekopíruje.
+    """
+    numeric = getattr(data, "numeric", None)
+    if numeric is not None and key in numeric:
+        return np.frombuffer(numeric[key], dtype=np.float64)
+    return np.array([math.nan if v is None else v for v in _float_values(data, key)], dtype=np.float64)
+
+
+def score_mask(data, min_score, max_score, score_key="Happiness score"):
+    """Booleovská maska řádků s hodnotou v <min, max> (vyžaduje NumPy)."""
+    col = numeric_array(data, score_key)
+    # NaN se v porovnání vyhodnotí jako False, chybějící hodnoty tedy vypadnou
+    return (col >= min_score) & (col <= max_score)
+
+
+def filter_by_score_range(data, min_score, max_score, score_key="Happiness score", backend=None):
+    """
+    Stejné jako filters.filter_by_score_range, ale přes masku NumPy.
+    Args:
+        data (list nebo ColumnarData): Data s náhodným přístupem k řádkům.
+        backend (str): 'numpy', 'python' nebo None (automaticky).
+    Returns:
+        list: Záznamy v zadaném rozsahu v původním pořadí.
+    """
+    if _backend(backend) == "python":
+        return list(filters.filter_by_score_range(data, min_score, max_score, score_key))
+    positions = np.flatnonzero(score_mask(data, min_score, max_score, score_key))
+    return [data[i] for i in positions.tolist()]
+
+
+def _summary_python(values, stats):
+    """Statistiky pro seznam hodnot v čistém Pythonu."""
+    values = [v for v in values if v is not None and v == v]
+    out = {}
+    for stat in stats:
+        if stat == "count":
+            out[stat] = len(values)
+        elif not values:
+            out[stat] = math.nan
+        elif stat == "mean":
+            out[stat] = math.fsum(values) / len(values)
+        elif stat == "median":
+            out[stat] = statistics.median(values)
+        elif stat == "std":
+            out[stat] = statistics.pstdev(values)
+        elif stat == "min":
+            out[stat] = min(values)
+        elif stat == "max":
+            out[stat] = max(values)
+    return out
+
+
+def _summary_numpy(values, stats):
+    """Statistiky pro pole NumPy (NaN se vynechají)."""
+    values = values[~np.isnan(values)]
+    out = {}
+    for stat in stats:
+        if stat == "count":
+            out[stat] = int(values.size)
+        elif not values.size:
+            out[stat] = math.nan
+        else:
+            # std s ddof=0 odpovídá statistics.pstdev
+            out[stat] = float(getattr(np, stat)(values))
+    return out
+
+
+def group_stats(data, by=("Regional indicator",), columns=("Happiness score",),
+                stats=("mean", "median", "std"), backend=None):
+    """
+    Souhrnné statistiky číselných sloupců po skupinách.
+    Příklad: group_stats(panel, by=("Regional indicator", "Year")).
+    Args:
+        data (list nebo ColumnarData): Data.
+        by (tuple[str]): Sloupce, podle kterých se skupiny tvoří.
+        columns (tuple[str]): Číselné sloupce ke shrnutí.
+        stats (tuple[str]): Statistiky z STATS.
+        backend (str): 'numpy', 'python' nebo None (automaticky).
+    Returns:
+        dict: {klíč skupiny (tuple): {sloupec: {statistika: hodnota}}},
+            seřazené podle klíče skupiny.
+    """
+    unknown = set(stats) - set(STATS)
+    if unknown:
+        raise ValueError(f"Neznámé statistiky: {', '.join(sorted(unknown))}")
+
+    if _backend(backend) == "python":
+        groups = {}
+        for i, key in enumerate(zip(*(column_values(data, k) for k in by))):
+            groups.setdefault(key, []).append(i)
+        result = {key: {} for key in sorted(groups)}
+        for col in columns:
+            values = _float_values(data, col)
+            for key, rows in result.items():
+                rows[col] = _summary_python([values[i] for i in groups[key]], stats)
+        return result
+
+    # Kódy skupin: np.unique pro každý sloupec klíče, pak jejich kombinace
+    numeric = getattr(data, "numeric", {})
+    uniques, inverses = [], []
+    for k in by:
+        values = numeric_array(data, k) if k in numeric else np.asarray(column_values(data, k), dtype=object)
+        u, inv = np.unique(values, return_inverse=True)
+        uniques.append(u.tolist())
+        inverses.append(inv.ravel())
+    combined = np.ravel_multi_index(inverses, [len(u) for u in uniques])
+    group_ids, codes = np.unique(combined, return_inverse=True)
+    keys = [tuple(u[j] for u, j in zip(uniques, np.unravel_index(g, [len(u) for u in uniques])))
+            for g in group_ids.tolist()]
+    # Seřazení řádků podle skupiny; hranice skupin tam, kde se kód mění
+    order = np.argsort(codes.ravel(), kind="stable")
+    bounds = np.flatnonzero(np.diff(codes.ravel()[order])) + 1
+    result = {key: {} for key in keys}
+    for col in columns:
+        parts = np.split(numeric_array(data, col)[order], bounds)
+        for key, part in zip(keys, parts):
+            result[key][col] = _summary_numpy(part, stats)
+    return result
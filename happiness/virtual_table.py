@@ -0,0 +1,160 @@
+"""Virtualizovaná tabulka (ttk.Treeview) pro velké množství záznamů."""
+from tkinter import ttk
+
+
+def format_value(value):
+    """Převede hodnotu záznamu na text do buňky tabulky."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else f"{value:g}"
+    return str(value)
+
+
+class VirtualTable(ttk.Frame):
+    """
+    Tabulka, která vytváří položky Treeview jen pro viditelné řádky (plus
+    malou rezervu). Při posouvání se položky nevytváří znovu, jen se jim
+    přepíšou hodnoty – paměť i čas otevření nezávisí na počtu záznamů.
+    Args:
+        master: Rodičovský widget.
+        columns (list[str]): Klíče sloupců (zároveň nadpisy).
+        rows (Sequence): Záznamy (slovníky) s náhodným přístupem.
+        buffer (int): Počet položek navíc pod viditelnou částí.
+    """
+
+    def __init__(self, master, columns, rows=(), buffer=10, **kwargs):
+        super().__init__(master, **kwargs)
+        self.columns = list(columns)
+        self.rows = rows
+        self.buffer = buffer
+        self.offset = 0
+        # Pool položek Treeview a hodnoty, které v nich právě jsou
+        self._items = []
+        self._shown = []
+        self._visible = 1
+        self._row_height = 20
+        self._header = 24
+        self._selected = None
+
+        self.tree = ttk.Treeview(self, columns=self.columns, show="headings", selectmode="browse")
+        for col in self.columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=180)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        # Posouvání kolečkem myši (Windows/macOS a X11) a klávesami
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.render()
+
+    # ----------------- Veřejné API -----------------
+    def set_rows(self, rows):
+        """Nahradí zobrazované záznamy; položky Treeview se jen přepíšou."""
+        self.rows = rows
+        self.offset = 0
+        self._selected = None
+        self.render()
+
+    def scroll(self, amount, what="units"):
+        """Posune zobrazení o ``amount`` řádků ('units') nebo stránek ('pages')."""
+        step = self._visible if what == "pages" else 1
+        self.scroll_to(self.offset + int(amount) * step)
+        return "break"
+
+    def scroll_to(self, offset):
+        """Zobrazí záznamy od pozice ``offset``."""
+        top = max(len(self.rows) - self._visible, 0)
+        offset = min(max(int(offset), 0), top)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def selected_row(self):
+        """Vrátí vybraný záznam, nebo None."""
+        if self._selected is None or self._selected >= len(self.rows):
+            return None
+        return self.rows[self._selected]
+
+    def render(self):
+        """Přepíše hodnoty položek podle aktuální pozice a aktualizuje posuvník."""
+        self._ensure_pool()
+        total = len(self.rows)
+        for k, iid in enumerate(self._items):
+            i = self.offset + k
+            if i < total:
+                row = self.rows[i]
+                values = tuple(format_value(row.get(c)) for c in self.columns)
+                if self._shown[k] is None:
+                    # položka byla skrytá (málo záznamů) – vrátíme ji na místo
+                    self.tree.move(iid, "", k)
+                if values != self._shown[k]:
+                    self.tree.item(iid, values=values)
+                self._shown[k] = values
+            elif self._shown[k] is not None:
+                self.tree.detach(iid)
+                self._shown[k] = None
+        # Výběr drží záznam, ne položku Treeview
+        k = None if self._selected is None else self._selected - self.offset
+        target = ()
+        if k is not None and 0 <= k < len(self._items) and self._shown[k] is not None:
+            target = (self._items[k],)
+        if tuple(self.tree.selection()) != target:
+            self.tree.selection_set(target)
+        if total:
+            self.scrollbar.set(self.offset / total, min((self.offset + self._visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # ----------------- Interní -----------------
+    def _ensure_pool(self):
+        """Doplní pool položek na počet viditelných řádků + rezervu."""
+        needed = self._visible + self.buffer
+        while len(self._items) < needed:
+            self._items.append(self.tree.insert("", "end", values=()))
+            self._shown.append(())
+
+    def _on_resize(self, event):
+        # Výšku řádku a hlavičky změříme na první položce (bbox vrací x, y, šířka, výška)
+        if self._items and self._shown[0] is not None:
+            box = self.tree.bbox(self._items[0])
+            if box:
+                self._header, self._row_height = box[1], box[3] or self._row_height
+        self._visible = max(1, (event.height - self._header) // self._row_height)
+        self.scroll_to(self.offset)
+        self.render()
+
+    def _on_scrollbar(self, action, amount, what=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.rows))
+        else:
+            self.scroll(int(amount), what)
+
+    def _move_selection(self, delta):
+        """Posun výběru šipkami – podle potřeby posune i zobrazení."""
+        if not len(self.rows):
+            return "break"
+        current = self.offset if self._selected is None else self._selected + delta
+        self._selected = min(max(current, 0), len(self.rows) - 1)
+        if self._selected < self.offset:
+            self.scroll_to(self._selected)
+        elif self._selected >= self.offset + self._visible:
+            self.scroll_to(self._selected - self._visible + 1)
+        self.render()
+        return "break"
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._items:
+            self._selected = self.offset + self._items.index(selection[0])
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
+from tasks.registry import TaskRegistry
 
 """
 Výuková aplikace: Procvičování základů Pythonu s Tkinterem
@@ -29,26 +30,32 @@ def clear_frame(frame: tk.Widget):
         child.destroy()
 
 # --------------------------- Úlohy -------------------------------------------
+# Registr úloh: každá funkce označená dekorátorem @TASKS.task(...) se objeví
+# v seznamu vlevo i v menu "Úlohy" (číslo order určuje pořadí)
+TASKS = TaskRegistry()
+
+
+@TASKS.task("1. Pozdrav funkcí", order=1)
 def task_1(parent: tk.Widget):
     frame = ttk.Frame(parent)
     return frame
 
 
+@TASKS.task("2. Součet 1..N", order=2)
 def task_2():
     pass
 
 
+@TASKS.task("3. FizzBuzz", order=3)
 def task_3():
     pass
 
 
-# --------------------------- Aplikace ----------------------------------------
+# Hotová řešení lze místo toho načíst z balíčku tasks (importují se až při otevření):
+# TASKS = TaskRegistry().discover("tasks")
 
-TASKS = [
-    ("1. Pozdrav funkcí", task_1),
-    ("2. Součet 1..N", task_2),
-    ("3. FizzBuzz", task_3),
-]
+
+# --------------------------- Aplikace ----------------------------------------
 
 
 # Třída hlavní aplikace, která spravuje okno, menu a přepínání úloh
@@ -82,10 +89,10 @@ class App(tk.Tk):
         self.listbox = tk.Listbox(sidebar, height=18, activestyle="dotbox")
         # Poté ho zabalíme do sidebaru s vertikálním vyplněním (pady) 6 pixelů
         self.listbox.pack(fill="y", expand=False, pady=6)
-        # Naplnění Listboxu názvy úloh z konstanty TASKS
-        # name je název úlohy, _ je funkce pro vytvoření obsahu (kterou zde nepotřebujeme)
-        for name, _ in TASKS:
-            self.listbox.insert("end", name)
+        # Naplnění Listboxu názvy úloh z registru TASKS
+        # task.title je název úlohy; funkci pro vytvoření obsahu zde nepotřebujeme
+        for task in TASKS:
+            self.listbox.insert("end", task.title)
 
         # Tlačítko pro otevření vybrané úlohy
         # Při kliknutí zavolá metodu open_selected, která otevře vybranou úlohu
@@ -117,9 +124,9 @@ class App(tk.Tk):
         # Menu pro výběr úloh, každá úloha je položka menu, při kliknutí se otevře
         m_tasks = tk.Menu(menubar, tearoff=False)
         # Pro každou úlohu přidáme položku do menu podle jejího indexu
-        for idx, (name, _) in enumerate(TASKS):
+        for idx, task in enumerate(TASKS):
             # Použití lambda výrazu/funkce pro zachycení aktuálního indexu
-            m_tasks.add_command(label=name, command=lambda i=idx: self.open_task(i))
+            m_tasks.add_command(label=task.title, command=lambda i=idx: self.open_task(i))
         # Přidání menu úloh do hlavního menu pod názvem "Úlohy"
         menubar.add_cascade(label="Úlohy", menu=m_tasks)
 
@@ -189,11 +196,12 @@ class App(tk.Tk):
         self.open_task(idx[0])
 
     def open_task(self, index: int):
-        """Otevře úlohu podle jejího indexu v seznamu TASKS."""
+        """Otevře úlohu podle jejího indexu v registru TASKS."""
         # Vyčištění obsahu před zobrazením nové úlohy
         clear_frame(self.content)
-        # Každá úloha vrací připravený Frame
-        _, builder = TASKS[index]
+        # Každá úloha vrací připravený Frame; load() vrátí funkci úlohy
+        # (u úloh z balíčku tasks ji teprve teď naimportuje)
+        builder = TASKS[index].load()
         # Vytvoření a umístění frame s úlohou
         task_frame = builder(self.content)
         # Umístění frame s úlohou, roztáhne se na celou dostupnou plochu
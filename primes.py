@@ -0,0 +1,127 @@
+"""Prvočísla do N Eratosthenovým sítem (i segmentovaným pro velká N).
+
+Síto je ``bytearray`` (1 bajt na číslo, 1 = prvočíslo); násobky se
+škrtají přiřazením do řezu, tedy bez cyklu přes jednotlivá čísla v Pythonu.
+Pro velká N se čísla zpracují po segmentech – paměť je pak úměrná
+√N + velikost segmentu a výsledky lze vypisovat průběžně.
+"""
+import math
+from itertools import compress
+
+# Do kolika se použije jedno síto pro celý rozsah, nad tím segmenty
+SIEVE_LIMIT = 1_000_000
+# Počet čísel v jednom segmentu (zároveň velikost dávky výsledků)
+SEGMENT_SIZE = 1 << 16
+
+
+def sieve(n):
+    """
+    Eratosthenovo síto.
+    Returns:
+        bytearray: Délky n + 1; na indexu k je 1, pokud je k prvočíslo.
+    """
+    if n < 2:
+        return bytearray(max(n + 1, 0))
+    flags = bytearray([1]) * (n + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if flags[p]:
+            # Škrtáme od p², menší násobky už škrtla menší prvočísla
+            flags[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return flags
+
+
+def primes_up_to(n):
+    """Seznam všech prvočísel ≤ n."""
+    return list(compress(range(n + 1), sieve(n)))
+
+
+def _segment(low, high, base):
+    """Prvočísla v intervalu <low, high) pomocí prvočísel ``base`` (všechna ≤ √high)."""
+    flags = bytearray([1]) * (high - low)
+    for p in base:
+        if p * p >= high:
+            break
+        # První násobek p v segmentu (nejméně p², aby se neškrtlo samo p)
+        start = max(p * p, (low + p - 1) // p * p)
+        flags[start - low::p] = bytes(len(range(start, high, p)))
+    return list(compress(range(low, high), flags))
+
+
+def primes_in_range(low, high):
+    """
+    Prvočísla v intervalu <low, high) – jeden segment síta.
+    Paměť je úměrná √high + (high - low), takže se hodí jako samostatná
+    dávka výpočtu (např. v procesu na pozadí).
+    """
+    low = max(low, 2)
+    if high <= low:
+        return []
+    return _segment(low, high, primes_up_to(math.isqrt(high - 1)))
+
+
+def segmented_primes(n, segment_size=SEGMENT_SIZE):
+    """
+    Segmentované síto: prvočísla ≤ n po segmentech.
+    Yields:
+        list[int]: Prvočísla jednoho segmentu (prázdné segmenty se vynechají).
+    """
+    if n < 2:
+        return
+    base = primes_up_to(math.isqrt(n))
+    for low in range(2, n + 1, segment_size):
+        chunk = _segment(low, min(low + segment_size, n + 1), base)
+        if chunk:
+            yield chunk
+
+
+def prime_chunks(n, chunk_size=SEGMENT_SIZE):
+    """
+    Prvočísla ≤ n po dávkách: do SIEVE_LIMIT jedno síto, nad ním segmenty.
+    Yields:
+        list[int]: Další dávka prvočísel ve vzestupném pořadí.
+    """
+    if n > SIEVE_LIMIT:
+        yield from segmented_primes(n, chunk_size)
+        return
+    primes = primes_up_to(n)
+    for i in range(0, len(primes), chunk_size):
+        yield primes[i:i + chunk_size]
+
+
+def count_primes(n, segment_size=SEGMENT_SIZE):
+    """Počet prvočísel ≤ n (bez vytváření seznamu)."""
+    if n <= SIEVE_LIMIT:
+        return sieve(n).count(1)
+    return sum(len(chunk) for chunk in segmented_primes(n, segment_size))
+
+
+class GapStats:
+    """
+    Průběžná statistika prvočísel: počet a mezery mezi sousedními prvočísly.
+    Dávky se přidávají metodou ``add`` ve vzestupném pořadí.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.first = None
+        self.last = None
+        self.max_gap = 0
+
+    def add(self, chunk):
+        if not chunk:
+            return
+        if self.last is not None:
+            self.max_gap = max(self.max_gap, chunk[0] - self.last)
+        else:
+            self.first = chunk[0]
+        self.max_gap = max([self.max_gap] + [b - a for a, b in zip(chunk, chunk[1:])])
+        self.count += len(chunk)
+        self.last = chunk[-1]
+
+    @property
+    def mean_gap(self):
+        """Průměrná mezera (součet mezer je rozdíl posledního a prvního prvočísla)."""
+        if self.count < 2:
+            return None
+        return (self.last - self.first) / (self.count - 1)
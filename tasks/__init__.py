@@ -0,0 +1 @@
+"""Úlohy aplikace app.py – každý modul s TITLE, ORDER a build(parent) je jedna úloha (viz registry)."""
@@ -0,0 +1,59 @@
+"""Úloha 8: Kreslení na Canvas (cyklus + podmínka)."""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from drawing.batch import CanvasBatch
+
+TITLE = "8. Kreslení na Canvas"
+ORDER = 8
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 8 – Kreslení čtverců na Canvas", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Vykresli N čtverců vedle sebe. Sudé budou vyplněné, liché prázdné.\n"
+        "Procvičíš: for, if, práci s Canvas."
+    )).pack(anchor="w", pady=(0,8))
+
+    row = ttk.Frame(frame); row.pack(fill="x", pady=4)
+    ttk.Label(row, text="N:").pack(side="left")
+    n_var = tk.StringVar(value="12")
+    ttk.Entry(row, textvariable=n_var, width=8).pack(side="left", padx=6)
+
+    c = tk.Canvas(frame, width=600, height=120, background="#ffffff")
+    c.pack(fill="x", pady=8)
+
+    def draw():
+        try:
+            n = int(n_var.get())
+            if n <= 0:
+                raise ValueError
+        except ValueError:
+            c.delete("all")
+            messagebox.showerror("Chyba", "Zadej kladné celé číslo N.")
+            return
+        size = 40
+        margin = 6
+        x = margin
+        y = margin
+        width = c.winfo_width()
+        # Všechny příkazy plátna se pošlou do Tcl najednou (jedno volání místo N)
+        with CanvasBatch(c) as batch:
+            batch.delete("all")
+            for i in range(1, n + 1):
+                x2 = x + size
+                y2 = y + size
+                if i % 2 == 0:
+                    # sudé vyplněné
+                    batch.create("rectangle", x, y, x2, y2, fill="#87CEFA", outline="#333333")
+                else:
+                    # liché prázdné
+                    batch.create("rectangle", x, y, x2, y2, outline="#333333", width=2)
+                x += size + margin
+                if x2 + size + margin > width:
+                    # nový řádek, když se nevejdeme
+                    x = margin
+                    y += size + margin
+
+    ttk.Button(frame, text="Vykresli", command=draw).pack(anchor="w")
+    return frame
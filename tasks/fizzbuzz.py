@@ -0,0 +1,64 @@
+"""Úloha 3: FizzBuzz (podmínky + cyklus)."""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from .support import TextWriter, compute_chunks
+
+TITLE = "3. FizzBuzz"
+ORDER = 3
+
+
+# Kolik čísel zpracuje jeden výpočet v poolu (zároveň velikost dávky výpisu)
+JOB_SEGMENT = 1 << 16
+
+
+def fizzbuzz_range(low: int, high: int) -> list[str]:
+    """FizzBuzz pro čísla v intervalu <low, high)."""
+    out = []
+    for i in range(low, high):
+        if i % 15 == 0:
+            out.append("FizzBuzz")
+        elif i % 3 == 0:
+            out.append("Fizz")
+        elif i % 5 == 0:
+            out.append("Buzz")
+        else:
+            out.append(str(i))
+    return out
+
+
+def fizzbuzz(n: int) -> list[str]:
+    return fizzbuzz_range(1, n + 1)
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 3 – FizzBuzz", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Vypiš čísla 1..N, ale: násobky 3 nahraď 'Fizz', násobky 5 'Buzz', násobky 15 'FizzBuzz'.\n"
+        "Procvičíš: zbytek po dělení (%), if/elif/else, for."
+    )).pack(anchor="w", pady=(0,8))
+
+    row = ttk.Frame(frame)
+    row.pack(fill="x", pady=4)
+    ttk.Label(row, text="N:").pack(side="left")
+    n_var = tk.StringVar(value="30")
+    ttk.Entry(row, textvariable=n_var, width=10).pack(side="left", padx=6)
+
+    text = tk.Text(frame, width=48, height=10)
+    text.pack(fill="both", expand=True, pady=6)
+    writer = TextWriter(text)
+
+    def run():
+        try:
+            n = int(n_var.get())
+            if n <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Chyba", "Zadej kladné celé číslo N.")
+            return
+        # Čísla 1..N po úsecích (fizzbuzz_range) – každý úsek se vypíše, jakmile je hotový
+        writer.start()
+        compute_chunks(frame, writer, fizzbuzz_range, 1, n + 1, step=JOB_SEGMENT)
+
+    ttk.Button(frame, text="Vypiš", command=run).pack(anchor="w")
+    return frame
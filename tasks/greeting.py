@@ -0,0 +1,39 @@
+"""Úloha 1: Pozdrav funkcí (funkce + podmínka)."""
+import tkinter as tk
+from tkinter import ttk
+
+TITLE = "1. Pozdrav funkcí"
+ORDER = 1
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+
+    ttk.Label(frame, text="Úloha 1 – Pozdrav funkcí", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0, 6))
+    ttk.Label(frame, text=(
+        "Zadej své jméno a stiskni tlačítko. Funkce greet rozhodne, jaký pozdrav zobrazit.\n"
+        "Procvičíš: definici funkce, podmínky if/else."
+    )).pack(anchor="w", pady=(0, 8))
+
+    row = ttk.Frame(frame)
+    row.pack(fill="x", pady=4)
+    ttk.Label(row, text="Jméno:").pack(side="left")
+    name_var = tk.StringVar()
+    ttk.Entry(row, textvariable=name_var, width=24).pack(side="left", padx=6)
+
+    output = tk.StringVar(value="Čekám na zadání…")
+    ttk.Label(frame, textvariable=output, foreground="#205b2b").pack(anchor="w", pady=6)
+
+    def greet(name: str) -> str:
+        # Funkce + podmínka
+        name = name.strip()
+        if not name:
+            return "Nejprve zadej jméno."
+        # Příklad další podmínky – když jméno začíná na A
+        if name[0].lower() == "a":
+            return f"Ahoj, {name}! Áčka mají přednost 😄"
+        return f"Ahoj, {name}!"
+
+    ttk.Button(frame, text="Pozdrav", command=lambda: output.set(greet(name_var.get()))).pack(anchor="w")
+
+    return frame
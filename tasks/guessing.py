@@ -0,0 +1,54 @@
+"""Úloha 7: Hádej číslo (podmínky + cyklus na pokusy)."""
+import random
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+TITLE = "7. Hádej číslo"
+ORDER = 7
+
+
+class GuessingGame:
+    def __init__(self):
+        self.secret = random.randint(1, 100)
+        self.tries = 0
+
+    def guess(self, x: int) -> str:
+        self.tries += 1
+        if x < self.secret:
+            return "Větší!"
+        elif x > self.secret:
+            return "Menší!"
+        else:
+            return f"Správně 🎉 Za {self.tries} pokusů. Nové číslo je vygenerováno."
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 7 – Hádej číslo 1..100", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Zkus uhodnout tajné číslo. Po každém pokusu dostaneš nápovědu.\n"
+        "Procvičíš: podmínky, počítání pokusů, práci se stavem."
+    )).pack(anchor="w", pady=(0,8))
+
+    game = GuessingGame()
+
+    row = ttk.Frame(frame); row.pack(fill="x", pady=4)
+    ttk.Label(row, text="Tip:").pack(side="left")
+    tip_var = tk.StringVar()
+    ttk.Entry(row, textvariable=tip_var, width=10).pack(side="left", padx=6)
+
+    out = tk.StringVar(value="Zadej číslo a stiskni Hádej…")
+    ttk.Label(frame, textvariable=out, foreground="#205b2b").pack(anchor="w", pady=6)
+
+    def run():
+        try:
+            x = int(tip_var.get())
+            msg = game.guess(x)
+            out.set(msg)
+            if "Správně" in msg:
+                game.__init__()  # rychlý reset (nové tajné číslo)
+        except ValueError:
+            messagebox.showerror("Chyba", "Zadej celé číslo 1..100.")
+
+    ttk.Button(frame, text="Hádej", command=run).pack(anchor="w")
+    return frame
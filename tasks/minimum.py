@@ -0,0 +1,54 @@
+"""Úloha 5: Minimum ze seznamu (cyklus + podmínka)."""
+import tkinter as tk
+from tkinter import ttk
+from .support import compute
+
+TITLE = "5. Minimum v seznamu"
+ORDER = 5
+
+
+def parse_numbers(s: str) -> list[float]:
+    nums = []
+    for part in s.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        nums.append(float(part))
+    return nums
+
+
+def min_manual(nums: list[float]) -> float:
+    if not nums:
+        raise ValueError("Seznam je prázdný")
+    m = nums[0]
+    for x in nums[1:]:
+        if x < m:
+            m = x
+    return m
+
+
+def min_of_text(s: str) -> float:
+    return min_manual(parse_numbers(s))
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 5 – Nejmenší číslo v seznamu", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Zadej čísla oddělená čárkou a zjisti minimum bez použití built-in min().\n"
+        "Procvičíš: parsování vstupu, for, podmíněné přiřazení."
+    )).pack(anchor="w", pady=(0,8))
+
+    entry = ttk.Entry(frame, width=48)
+    entry.insert(0, "10, 3, 7, -2, 5")
+    entry.pack(anchor="w", pady=4)
+
+    result = tk.StringVar(value="Výsledek se zobrazí zde…")
+    ttk.Label(frame, textvariable=result, foreground="#205b2b").pack(anchor="w", pady=6)
+
+    def run():
+        # min_of_text (parse_numbers + min_manual výše) běží přes compute; chybu vstupu ukáže dialog
+        compute(frame, min_of_text, entry.get(), on_done=lambda m: result.set(f"Minimum = {m}"))
+
+    ttk.Button(frame, text="Zjisti minimum", command=run).pack(anchor="w")
+    return frame
@@ -0,0 +1,63 @@
+"""Úloha 4: Násobilková tabulka (vnořený cyklus)."""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from .support import TextWriter, compute_chunks
+
+TITLE = "4. Násobilková tabulka"
+ORDER = 4
+
+
+# Kolik buněk tabulky spočítá jeden výpočet v poolu (řádků je tedy JOB_CELLS // M)
+JOB_CELLS = 1 << 16
+
+
+def multiplication_rows(low: int, high: int, m: int) -> list[str]:
+    """Řádky low..high-1 tabulky s M sloupci."""
+    lines = []
+    for i in range(low, high):
+        row_vals = []
+        for j in range(1, m + 1):
+            row_vals.append(f"{i*j:>4}")
+        lines.append("".join(row_vals))
+    return lines
+
+
+def multiplication_table(n: int, m: int) -> list[str]:
+    return multiplication_rows(1, n + 1, m)
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 4 – Násobilková tabulka", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Vygeneruj tabulku N×M pomocí vnořených cyklů.\n"
+        "Procvičíš: for v for, formátování řetězců."
+    )).pack(anchor="w", pady=(0,8))
+
+    row = ttk.Frame(frame)
+    row.pack(fill="x", pady=4)
+    n_var = tk.StringVar(value="5")
+    m_var = tk.StringVar(value="5")
+    ttk.Label(row, text="N:").pack(side="left")
+    ttk.Entry(row, textvariable=n_var, width=6).pack(side="left", padx=6)
+    ttk.Label(row, text="M:").pack(side="left")
+    ttk.Entry(row, textvariable=m_var, width=6).pack(side="left", padx=6)
+
+    text = tk.Text(frame, width=48, height=10)
+    text.pack(fill="both", expand=True, pady=6)
+    writer = TextWriter(text)
+
+    def run():
+        try:
+            n = int(n_var.get()); m = int(m_var.get())
+            if n <= 0 or m <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Chyba", "N a M musí být kladná celá čísla.")
+            return
+        # Řádky 1..N po úsecích (multiplication_rows) – každý úsek se vypíše, jakmile je hotový
+        writer.start()
+        compute_chunks(frame, writer, multiplication_rows, 1, n + 1, m, step=max(JOB_CELLS // m, 1))
+
+    ttk.Button(frame, text="Vygeneruj", command=run).pack(anchor="w")
+    return frame
@@ -0,0 +1,64 @@
+"""Úloha 6: Prvočísla do N (cykly + podmínky)."""
+import tkinter as tk
+from tkinter import ttk, messagebox
+from primes import GapStats, primes_in_range
+from .support import TextWriter, compute_chunks
+
+TITLE = "6. Prvočísla do N"
+ORDER = 6
+
+
+# Kolik čísel prosévá jeden výpočet v poolu (paměť výpočtu i velikost dávky výsledků)
+JOB_SEGMENT = 1 << 20
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 6 – Prvočísla do N", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Vypiš všechna prvočísla ≤ N Eratosthenovým sítem (pro velká N po segmentech).\n"
+        "Procvičíš: cykly, seznamy a řezy, počítání statistik za běhu."
+    )).pack(anchor="w", pady=(0,8))
+
+    row = ttk.Frame(frame)
+    row.pack(fill="x", pady=4)
+    ttk.Label(row, text="N:").pack(side="left")
+    n_var = tk.StringVar(value="50")
+    ttk.Entry(row, textvariable=n_var, width=10).pack(side="left", padx=6)
+
+    text = tk.Text(frame, width=48, height=10)
+    text.pack(fill="both", expand=True, pady=6)
+    status = ttk.Label(frame, text="")
+    status.pack(anchor="w")
+
+    # Prvočísla oddělená čárkou; ve widgetu jen prvních max_items
+    writer = TextWriter(text, sep=", ", max_items=20_000)
+
+    def summary(stats):
+        mean = "–" if stats.mean_gap is None else f"{stats.mean_gap:.2f}"
+        status.config(text=f"Počet prvočísel: {stats.count}, průměrná mezera: {mean}, největší mezera: {stats.max_gap}")
+
+    def failed(error):
+        status.config(text="")
+        messagebox.showerror("Chyba", str(error))
+
+    def run():
+        status.config(text="")
+        try:
+            N = int(n_var.get())
+        except ValueError:
+            writer.cancel()
+            messagebox.showerror("Chyba", "Zadej celé číslo N.")
+            return
+        if N < 2:
+            writer.write(["Pro N < 2 nejsou žádná prvočísla."])
+            return
+        stats = GapStats()
+        writer.start(on_done=lambda count: summary(stats),
+                     on_progress=lambda count: status.config(text=f"Nalezeno {count} prvočísel…"))
+        # Segmenty <low, high) se prosévají v poolu (primes_in_range) a vypisují postupně
+        compute_chunks(frame, writer, primes_in_range, 2, N + 1, step=JOB_SEGMENT, on_chunk=stats.add,
+                       on_error=failed)
+
+    ttk.Button(frame, text="Vypiš prvočísla", command=run).pack(anchor="w")
+    return frame
@@ -0,0 +1,133 @@
+"""Registr úloh: seznam úloh bez importu jejich kódu.
+
+Úloha je modul s konstantami ``TITLE`` (název v seznamu) a ``ORDER``
+(pořadí) a funkcí ``build(parent)``, která vrátí hotový ttk.Frame.
+Registr najde úlohy dvěma způsoby:
+
+- moduly v balíčku (výchozí ``tasks``) – konstanty se přečtou ze
+  zdrojového kódu (ast), modul se neimportuje,
+- vstupní body (entry points) skupiny ENTRY_POINT_GROUP z nainstalovaných
+  balíčků, např. ``moje_ulohy.rekurze:build``.
+
+Funkce ``build`` se naimportuje až při prvním otevření úlohy.
+"""
+import ast
+import importlib
+import importlib.util
+import pkgutil
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+# Skupina vstupních bodů pro úlohy z jiných balíčků
+ENTRY_POINT_GROUP = "python_tkinter.tasks"
+# Pořadí úloh, které ORDER neuvádí (zařadí se na konec)
+DEFAULT_ORDER = 1000
+
+
+class TaskInfo(NamedTuple):
+    """Údaje o úloze; ``builder`` je vyplněný jen u úloh registrovaných přímo funkcí."""
+    title: str
+    order: int
+    module: Optional[str] = None
+    attr: str = "build"
+    builder: Optional[Callable] = None
+
+    def load(self):
+        """Vrátí funkci, která sestaví úlohu (modul se naimportuje až teď)."""
+        if self.builder is not None:
+            return self.builder
+        return getattr(importlib.import_module(self.module), self.attr)
+
+
+def read_metadata(path):
+    """
+    Přečte TITLE a ORDER ze zdrojového kódu modulu (bez importu).
+    Returns:
+        dict: Nalezené konstanty, např. {"TITLE": "3. FizzBuzz", "ORDER": 3}.
+    """
+    tree = ast.parse(Path(path).read_bytes(), filename=str(path))
+    found = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in ("TITLE", "ORDER"):
+                try:
+                    found[name] = ast.literal_eval(node.value)
+                except ValueError:
+                    pass
+    return found
+
+
+def _entry_points(group):
+    try:
+        return metadata.entry_points(group=group)
+    except TypeError:  # Python < 3.10
+        return metadata.entry_points().get(group, [])
+
+
+class TaskRegistry:
+    """
+    Seznam úloh seřazený podle (ORDER, TITLE).
+    Úlohy lze přidat hledáním (``discover``) nebo přímo dekorátorem ``task``.
+    """
+
+    def __init__(self):
+        self._tasks = []
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+    def __getitem__(self, index):
+        return self._tasks[index]
+
+    def add(self, info):
+        """Přidá úlohu (TaskInfo) a udrží seznam seřazený."""
+        self._tasks.append(info)
+        self._tasks.sort(key=lambda t: (t.order, t.title))
+        return info
+
+    def task(self, title, order=DEFAULT_ORDER):
+        """Dekorátor pro registraci funkce, která sestaví úlohu."""
+        def register(builder):
+            self.add(TaskInfo(title, order, builder.__module__, builder.__name__, builder))
+            return builder
+        return register
+
+    def discover(self, package="tasks", group=ENTRY_POINT_GROUP):
+        """
+        Najde úlohy v balíčku ``package`` a ve vstupních bodech ``group``.
+        Moduly bez TITLE (např. pomocné) se přeskočí, stejně jako vstupní
+        body, jejichž modul nelze najít nebo přečíst (hlášení jde na stderr).
+        Returns:
+            TaskRegistry: self (kvůli řetězení).
+        """
+        spec = importlib.util.find_spec(package)
+        for module in pkgutil.iter_modules(spec.submodule_search_locations or []):
+            if module.ispkg or module.name.startswith("_"):
+                continue
+            path = Path(module.module_finder.path) / f"{module.name}.py"
+            if not path.exists():
+                continue
+            meta = read_metadata(path)
+            if "TITLE" in meta:
+                self.add(TaskInfo(meta["TITLE"], meta.get("ORDER", DEFAULT_ORDER), f"{package}.{module.name}"))
+
+        for ep in _entry_points(group):
+            module, _, attr = ep.value.partition(":")
+            meta = {}
+            # Rozbitý vstupní bod jiného balíčku nesmí shodit celou aplikaci
+            try:
+                origin = getattr(importlib.util.find_spec(module), "origin", None)
+                if origin and origin.endswith(".py"):
+                    meta = read_metadata(origin)
+            except (ImportError, ValueError, AttributeError, SyntaxError) as e:
+                print(f"Úloha {ep.name} ({ep.value}) se přeskočí: {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            self.add(TaskInfo(meta.get("TITLE", ep.name), meta.get("ORDER", DEFAULT_ORDER),
+                              module, attr.strip() or "build"))
+        return self
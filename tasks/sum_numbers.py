@@ -0,0 +1,49 @@
+"""Úloha 2: Součet 1..N (cyklus for + validace)."""
+import tkinter as tk
+from tkinter import ttk
+from .support import compute
+
+TITLE = "2. Součet 1..N"
+ORDER = 2
+
+
+def sum_to_n(n: int) -> int:
+    total = 0
+    for i in range(1, n + 1):
+        total += i
+    return total
+
+
+def build(parent: tk.Widget):
+    frame = ttk.Frame(parent)
+    ttk.Label(frame, text="Úloha 2 – Součet čísel 1..N", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(0,6))
+    ttk.Label(frame, text=(
+        "Zadej N a spočítej součet 1 + 2 + … + N pomocí cyklu for.\n"
+        "Procvičíš: převod vstupu na int, for, podmínky pro validaci."
+    )).pack(anchor="w", pady=(0,8))
+
+    row = ttk.Frame(frame)
+    row.pack(fill="x", pady=4)
+    ttk.Label(row, text="N:").pack(side="left")
+    n_var = tk.StringVar(value="10")
+    ttk.Entry(row, textvariable=n_var, width=10).pack(side="left", padx=6)
+
+    result = tk.StringVar(value="Výsledek se zobrazí zde…")
+    ttk.Label(frame, textvariable=result, foreground="#205b2b").pack(anchor="w", pady=6)
+
+    def run():
+        try:
+            n = int(n_var.get())
+            if n < 0:
+                result.set("N musí být nezáporné celé číslo.")
+                return
+        except ValueError:
+            result.set("Zadej celé číslo.")
+            return
+        result.set("Počítám…")
+        # Výpočet (sum_to_n) běží mimo okno, výsledek se zobrazí po dokončení
+        compute(frame, sum_to_n, n, on_done=lambda total: result.set(f"Součet 1..{n} = {total}"),
+                on_error=lambda e: result.set(f"Chyba: {e}"))
+
+    ttk.Button(frame, text="Spočítej", command=run).pack(anchor="w")
+    return frame
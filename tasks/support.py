@@ -0,0 +1,408 @@
+"""Sdílené pomocné třídy a funkce pro úlohy a hlavní okno aplikace.
+
+- TextWriter: postupný výpis velkého množství řádků do tk.Text,
+- TaskRunner + compute: výpočty úloh v poolu mimo smyčku Tk,
+- compute_chunks: výpočet po úsecích průběžně vypisovaný do TextWriter,
+- FrameCache: hotové rámce úloh se při přepnutí jen skryjí.
+"""
+import time
+import tkinter as tk
+from tkinter import messagebox
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+
+class TextWriter:
+    """
+    Postupný výpis velkého množství řádků do tk.Text bez zamrznutí okna.
+    Řádky se skládají do velkých dávek (jedno ``insert`` na dávku) a zapisují
+    se přes ``after`` – v jednom kroku jen tolik, kolik se vejde do
+    ``budget_ms``. Do widgetu se zapíše nejvýše ``max_items`` položek,
+    zbytek se jen dopočítá (kvůli statistikám) a vypíše se jejich počet.
+    Položky lze předat najednou (``write``), nebo postupně, jak přicházejí
+    (``start``, opakovaně ``feed`` a nakonec ``close``).
+    Args:
+        text (tk.Text): Cílový widget (při jeho zničení se výpis zastaví).
+        sep (str): Oddělovač položek (výchozí: každá položka na vlastní řádek).
+        max_items (int): Kolik položek nejvýše držet ve widgetu.
+        budget_ms (int): Časový rozpočet jednoho kroku.
+        batch (int): Počet položek v jednom volání ``insert``.
+    """
+
+    def __init__(self, text: tk.Text, sep="\n", max_items=10_000, budget_ms=10, batch=1000):
+        self.text = text
+        self.sep = sep
+        self.max_items = max_items
+        self.budget_ms = budget_ms
+        self.batch = batch
+        self.count = 0
+        # Číslo výpisu – zvýší se při každém start(), podle něj se poznají zastaralé dávky
+        self.run = 0
+        self._queue = None
+        self._closed = False
+        self._after = None
+        self._on_done = None
+        self._on_progress = None
+        text.bind("<Destroy>", lambda e: self.cancel(), add="+")
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def write(self, items, on_done=None, on_progress=None):
+        """
+        Smaže widget a začne vypisovat ``items`` (i generátor – čte se líně).
+        ``on_progress(count)`` se volá po každém kroku, ``on_done(count)`` na konci.
+        """
+        self.start(on_done, on_progress)
+        self.feed(items)
+        self.close()
+
+    def start(self, on_done=None, on_progress=None):
+        """Smaže widget a otevře výpis; položky se pak přidávají metodou ``feed``."""
+        self.cancel()
+        self.text.delete("1.0", "end")
+        self.count = 0
+        self.run += 1
+        self._queue = deque()
+        self._closed = False
+        self._on_done = on_done
+        self._on_progress = on_progress
+
+    def feed(self, items):
+        """Přidá další položky na konec výpisu."""
+        if self._queue is None:
+            return
+        self._queue.append(iter(items))
+        self._schedule()
+
+    def close(self):
+        """Žádné další položky nepřijdou – po vypsání fronty se výpis dokončí."""
+        if self._queue is None:
+            return
+        self._closed = True
+        self._schedule()
+
+    def cancel(self):
+        """Zastaví rozpracovaný výpis (už zapsané řádky zůstanou)."""
+        if self._after is not None:
+            self.text.after_cancel(self._after)
+            self._after = None
+        self._queue = None
+
+    def _schedule(self):
+        if self._after is None:
+            self._after = self.text.after_idle(self._step)
+
+    def _take(self, size):
+        """Až ``size`` dalších položek z fronty (prázdný seznam = fronta je prázdná)."""
+        while self._queue:
+            chunk = list(islice(self._queue[0], size))
+            if chunk:
+                return chunk
+            self._queue.popleft()
+        return []
+
+    def _step(self):
+        self._after = None
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while time.perf_counter() < deadline:
+            room = self.max_items - self.count
+            if room > 0:
+                chunk = self._take(min(self.batch, room))
+                if chunk:
+                    self.text.insert("end", (self.sep if self.count else "") + self.sep.join(chunk))
+            else:
+                # Limit widgetu je plný – zbytek jen spočítáme
+                chunk = self._take(self.batch * 10)
+            if not chunk:
+                if self._closed:
+                    self._finish()
+                    return
+                # Fronta je prázdná – další krok naplánuje až feed() nebo close()
+                break
+            self.count += len(chunk)
+        if self._on_progress is not None:
+            self._on_progress(self.count)
+        if self._queue:
+            self._after = self.text.after(1, self._step)
+
+    def _finish(self):
+        self._queue = None
+        hidden = self.count - self.max_items
+        self.text.insert("end", "\n" if hidden <= 0 else f"\n… a dalších {hidden} (zobrazeno prvních {self.max_items})\n")
+        if self._on_done is not None:
+            self._on_done(self.count)
+
+
+class _Job:
+    """Jeden výpočet v TaskRunner (funkce a argumenty kvůli případnému opakování)."""
+    __slots__ = ("fn", "args", "future", "deadline", "timeout", "on_done", "on_error", "owner")
+
+    def __init__(self, fn, args, deadline, timeout, on_done, on_error, owner):
+        self.fn = fn
+        self.args = args
+        self.future = None
+        self.deadline = deadline
+        self.timeout = timeout
+        self.on_done = on_done
+        self.on_error = on_error
+        self.owner = owner
+
+
+class TaskRunner:
+    """
+    Spouští čisté výpočty úloh v poolu (procesy nebo vlákna) mimo smyčku Tk.
+    Stav hotových výpočtů se kontroluje přes ``after`` a výsledek se předá
+    callbacku ve vlákně Tk. Výpočet, který nedoběhne do limitu, skončí
+    chybou TimeoutError; běží-li už v procesu, procesy poolu se ukončí
+    a ostatní rozpracované výpočty se spustí znovu v novém poolu.
+    Ve vláknech běžící výpočet ukončit nejde – jeho výsledek se jen zahodí.
+    Args:
+        widget: Widget pro plánování ``after`` (typicky hlavní okno).
+        kind (str): "process" (víc jader) nebo "thread".
+        on_busy (callable): Volá se s počtem běžících výpočtů při každé změně.
+    """
+
+    def __init__(self, widget, kind="process", max_workers=None, poll_ms=50, on_busy=None):
+        self.widget = widget
+        self.kind = kind
+        self.max_workers = max_workers
+        self.poll_ms = poll_ms
+        self.on_busy = on_busy
+        self._pool = None
+        self._jobs = []
+        self._after = None
+
+    def _executor(self):
+        # Pool vzniká až při prvním výpočtu; když procesy nejdou, použijí se vlákna
+        if self._pool is None:
+            if self.kind == "process":
+                try:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError):
+                    self.kind = "thread"
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def submit(self, fn, *args, on_done, on_error, timeout=None, owner=None):
+        """
+        Spustí ``fn(*args)`` v poolu; ``on_done(výsledek)`` nebo ``on_error(výjimka)``
+        se zavolá ve vlákně Tk. ``owner`` (např. rámec úlohy) umožní zrušit jen jeho výpočty.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        job = _Job(fn, args, deadline, timeout, on_done, on_error, owner)
+        job.future = self._executor().submit(fn, *args)
+        self._jobs.append(job)
+        self._busy()
+        if self._after is None:
+            self._after = self.widget.after(self.poll_ms, self._poll)
+        return job.future
+
+    def cancel(self, owner=None):
+        """Zruší výpočty vlastníka ``owner`` (None = všechny); čekající se nespustí, výsledky běžících se zahodí."""
+        keep = []
+        for job in self._jobs:
+            if owner is None or job.owner is owner:
+                job.future.cancel()
+            else:
+                keep.append(job)
+        self._jobs = keep
+        self._busy()
+
+    def shutdown(self):
+        """Zruší všechny výpočty a ukončí pool (procesy se ukončí hned, okno nečeká)."""
+        self.cancel()
+        if self._after is not None:
+            self.widget.after_cancel(self._after)
+            self._after = None
+        self._terminate_pool()
+
+    def _terminate_pool(self):
+        """Zahodí pool; u procesů ukončí i právě běžící výpočty."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if isinstance(pool, ProcessPoolExecutor):
+            terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+            if terminate is not None:
+                terminate()
+            else:
+                for process in list((pool._processes or {}).values()):
+                    process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _restart(self):
+        """Nový pool místo ukončeného; nedokončené výpočty se v něm spustí znovu."""
+        self._terminate_pool()
+        for job in self._jobs:
+            job.future = self._executor().submit(job.fn, *job.args)
+
+    def _busy(self):
+        if self.on_busy is not None:
+            self.on_busy(len(self._jobs))
+
+    def _poll(self):
+        self._after = None
+        now = time.perf_counter()
+        pending, finished, expired = [], [], []
+        for job in self._jobs:
+            if job.future.done():
+                finished.append(job)
+            elif job.deadline is not None and now > job.deadline:
+                expired.append(job)
+            else:
+                pending.append(job)
+        self._jobs = pending
+        # Čekající výpočet stačí zrušit; běžící v procesu ukončí jen nový pool
+        stuck = [job for job in expired if not job.future.cancel()]
+        if stuck and isinstance(self._pool, ProcessPoolExecutor):
+            self._restart()
+        if finished or expired:
+            self._busy()
+        for job in expired:
+            job.on_error(TimeoutError(f"Výpočet nedoběhl do {job.timeout:g} s."))
+        for job in finished:
+            if job.future.cancelled():
+                continue
+            if job.future.exception() is not None:
+                job.on_error(job.future.exception())
+            else:
+                job.on_done(job.future.result())
+        if self._jobs:
+            self._after = self.widget.after(self.poll_ms, self._poll)
+
+
+class FrameCache:
+    """
+    Hotové rámce úloh se při přepnutí nezničí, jen se skryjí (``grid_remove``)
+    a při návratu znovu zobrazí (``grid``) i se svým stavem. Nad ``limit``
+    rámců se ničí ten nejdéle nepoužitý; ``on_evict(frame)`` se zavolá
+    před jeho zničením (např. zrušení jeho výpočtů).
+    """
+
+    def __init__(self, parent: tk.Widget, limit=4, on_evict=None):
+        self.parent = parent
+        self.limit = limit
+        self.on_evict = on_evict
+        self.current = None
+        # klíč -> rámec; pořadí = od nejdéle nepoužitého
+        self._frames = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def show(self, key, build):
+        """Zobrazí rámec ``key``; pokud v mezipaměti není, vytvoří ho ``build(parent)``."""
+        if self.current is not None and self.current != key and self.current in self._frames:
+            self._frames[self.current].grid_remove()
+        frame = self._frames.get(key)
+        if frame is None or not frame.winfo_exists():
+            frame = self._frames[key] = build(self.parent)
+        self._frames.move_to_end(key)
+        frame.grid(row=0, column=0, sticky="nsew")
+        self.current = key
+        self._evict()
+        return frame
+
+    def reset(self, key=None):
+        """Zahodí rámec ``key`` (None = všechny); při dalším zobrazení vznikne znovu."""
+        for k in list(self._frames) if key is None else [key]:
+            if k in self._frames:
+                self._destroy(k)
+        if self.current not in self._frames:
+            self.current = None
+
+    def _evict(self):
+        while len(self._frames) > max(self.limit, 1):
+            oldest = next(iter(self._frames))
+            if oldest == self.current:
+                break
+            self._destroy(oldest)
+
+    def _destroy(self, key):
+        frame = self._frames.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(frame)
+        frame.destroy()
+
+
+# Časový limit výpočtu jedné úlohy (s)
+COMPUTE_TIMEOUT = 30
+
+
+def _show_error(error):
+    messagebox.showerror("Chyba", str(error))
+
+
+def compute(widget: tk.Widget, fn, *args, on_done, on_error=None, timeout=COMPUTE_TIMEOUT):
+    """
+    Spustí výpočet úlohy přes TaskRunner hlavního okna (atribut ``runner``).
+    Předchozí výpočet téhož widgetu se zruší – výsledek staršího spuštění
+    tak nikdy nepřepíše novější. Bez TaskRunneru (úloha vložená do jiného
+    okna) se ``fn`` zavolá hned. Výchozí ``on_error`` zobrazí chybu v dialogu.
+    """
+    if on_error is None:
+        on_error = _show_error
+    runner = getattr(widget.winfo_toplevel(), "runner", None)
+    if runner is None:
+        try:
+            result = fn(*args)
+        except Exception as e:
+            on_error(e)
+        else:
+            on_done(result)
+        return
+    runner.cancel(owner=widget)
+    runner.submit(fn, *args, on_done=on_done, on_error=on_error, timeout=timeout, owner=widget)
+
+
+def compute_chunks(widget: tk.Widget, writer: TextWriter, fn, start, stop, *args, step, on_chunk=None,
+                   on_error=None, timeout=COMPUTE_TIMEOUT):
+    """
+    Vypíše do otevřeného ``writer`` (po ``start()``) výsledky ``fn(low, high, *args)``
+    pro úseky <start, stop) po ``step`` čísel. Každý úsek je samostatný výpočet
+    (compute), další se spustí až po příchodu předchozího – celý výsledek tak není
+    najednou v paměti ani se z poolu nepřenáší vcelku. Po posledním úseku se
+    výpis uzavře. Nový ``writer.start()`` starší řetězec úseků zastaví.
+    Args:
+        fn (callable): Výpočet úseku, vrací seznam položek (převedou se na str).
+        on_chunk (callable): Volá se s každým výsledkem před výpisem (např. statistiky).
+        on_error (callable): Při chybě (výpis se zastaví), výchozí je dialog.
+    """
+    run = writer.run
+
+    def current():
+        return writer.run == run and writer.running
+
+    def submit(low):
+        if not current():
+            return
+        high = min(low + step, stop)
+        compute(widget, fn, low, high, *args, on_done=lambda chunk: got(high, chunk), on_error=failed,
+                timeout=timeout)
+
+    def got(high, chunk):
+        if not current():
+            return
+        if on_chunk is not None:
+            on_chunk(chunk)
+        writer.feed(map(str, chunk))
+        if high >= stop:
+            writer.close()
+        else:
+            # Další úsek až z event loopu (i bez poolu tak nevzniká hluboká rekurze)
+            widget.after_idle(submit, high)
+
+    def failed(error):
+        if not current():
+            return
+        writer.cancel()
+        (on_error or _show_error)(error)
+
+    if start >= stop:
+        writer.close()
+        return
+    submit(start)
@@ -1,7 +1,111 @@
-from happiness.data_loader import load_data
+import contextlib
+import gzip
+import io
+import json
+import math
+import os
+import tempfile
+import time
+import tkinter as tk
+from importlib import metadata
+from pathlib import Path
+from happiness.data_loader import load_data, load_panel, sniff_format, iter_data
+from happiness.dataset import ColumnarData
+from happiness.index import SortedColumn
+from happiness.query import Query
+from happiness.ui_menu import LiveSearch
+from happiness import vectorized
+from happiness.export import export_rows, read_columnar
+from drawing import benchmark
+import primes
+import sys
+from tasks import registry as registry_module
+from tasks.registry import ENTRY_POINT_GROUP, TaskRegistry, read_metadata
+from tasks.fizzbuzz import fizzbuzz
+from tasks.support import FrameCache, TaskRunner, TextWriter, compute, compute_chunks
+from drawing.batch import tcl_list_element, tcl_word
+from drawing.cache import SceneCache
+from drawing.scene import Scene
+from drawing.scheduler import FrameScheduler
+from drawing import raster
 from happiness.filters import find_country, filter_by_region, filter_by_score_range, to_float
 
 
+class FakeWidget:
+    """Náhrada widgetu pro testy bez displeje: after/after_idle jen zapisují do fronty."""
+
+    def __init__(self):
+        self.pending = {}
+        self._next = 0
+
+    def after(self, ms, callback, *args):
+        self._next += 1
+        self.pending[self._next] = (callback, args)
+        return self._next
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def winfo_toplevel(self):
+        return self
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        """Provede naplánovaná volání (i ta, která se mezitím naplánují znovu)."""
+        while self.pending:
+            after_id = min(self.pending)
+            callback, args = self.pending.pop(after_id)
+            callback(*args)
+
+
+class FakeText(FakeWidget):
+    """Náhrada tk.Text: obsah je řetězec, počítá se počet volání insert."""
+
+    def __init__(self):
+        super().__init__()
+        self.content = ""
+        self.inserts = 0
+
+    def bind(self, sequence, callback, add=None):
+        pass
+
+    def insert(self, index, text):
+        self.content += text
+        self.inserts += 1
+
+    def delete(self, first, last=None):
+        self.content = ""
+
+
+class FakeCanvasTk:
+    """Náhrada interpretu plátna: eval jen zapíše skript a vrátí id nově vytvořených položek."""
+
+    def __init__(self):
+        self.scripts = []
+        self._next_id = 0
+
+    def eval(self, script):
+        self.scripts.append(script)
+        created = script.count(" create ")
+        self._next_id += created
+        return " ".join(str(i) for i in range(self._next_id - created + 1, self._next_id + 1))
+
+    def splitlist(self, value):
+        return tuple(value.split())
+
+
+class FakeCanvas:
+    """Náhrada tk.Canvas pro Scene a CanvasBatch (cesta widgetu a interpret)."""
+
+    def __init__(self):
+        self.tk = FakeCanvasTk()
+
+    def __str__(self):
+        return ".canvas"
+
+
 def test_load_data(data):
     """Test načítání dat ze souboru CSV."""
     # Ověření, že data jsou načtena jako seznam
@@ -55,6 +159,583 @@ def test_filter_by_score_range(data, min_score=7.0, max_score=8.0, score_key="Ha
         assert min_score <= score <= max_score
 
 
+def test_load_columnar(path="happiness/world_happiness_2023.csv"):
+    """Test sloupcového načtení dat."""
+    # Načtení stejného souboru v obou režimech
+    rows = load_data(path, delimiter=';')
+    columnar = load_data(path, delimiter=';', columnar=True)
+    # Ověření typu a počtu záznamů
+    assert isinstance(columnar, ColumnarData)
+    assert len(columnar) == len(rows)
+    # Číselné sloupce jsou typované, textové zůstávají řetězci
+    assert "Happiness score" in columnar.numeric
+    assert "Country" in columnar.text
+    # Řádkový pohled vrací stejné hodnoty jako slovník
+    assert columnar[0]["Country"] == rows[0]["Country"]
+    assert columnar[0]["Happiness score"] == to_float(rows[0]["Happiness score"])
+    # Filtry fungují i nad sloupcovými daty
+    assert len(filter_by_region(columnar, "Western Europe")) == len(filter_by_region(rows, "Western Europe"))
+
+
+def test_load_panel(country_name="Czechia"):
+    """Test načtení všech ročníků do jednoho panelu."""
+    # Načtení všech ročních souborů najednou
+    panel = load_panel()
+    # Ověření, že panel obsahuje všech deset ročníků
+    assert panel.years == list(range(2015, 2025))
+    # Každý řádek je dostupný podle klíče (země, rok)
+    assert len(panel.keys) == len(panel)
+    row = panel[country_name, 2023]
+    assert row["Country"] == country_name
+    assert row["Year"] == 2023
+    # Neexistující kombinace vrací výchozí hodnotu
+    assert panel.get(country_name, 1999) is None
+
+
+def test_sniff_format():
+    """Test automatického rozpoznání formátu CSV."""
+    # Starší ročníky: středník a desetinná čárka
+    old = sniff_format("happiness/world_happiness_2019.csv")
+    assert (old.delimiter, old.decimal) == (";", ",")
+    # Ročník 2024: čárka a desetinná tečka
+    new = sniff_format("happiness/world_happiness_2024.csv")
+    assert (new.delimiter, new.decimal) == (",", ".")
+    # Sloupec "Ladder score" je přejmenován na jednotný název
+    assert "Happiness score" in new.columns
+    assert "Happiness score" in new.numeric
+    # Načtená čísla jsou už převedená na float
+    data = load_data("happiness/world_happiness_2024.csv")
+    assert isinstance(data[0]["Happiness score"], float)
+
+
+def test_load_cached(path="happiness/world_happiness_2023.csv"):
+    """Test načtení dat přes binární cache."""
+    # Cache do dočasné složky, aby test nezávisel na předchozím běhu
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # První načtení cache vytvoří, druhé ji jen otevře
+        first = load_data(path, columnar=True, cache=True, cache_dir=cache_dir)
+        second = load_data(path, columnar=True, cache=True, cache_dir=cache_dir)
+        # Číselné sloupce z cache jsou pohledy do souboru, ne nově parsovaná pole
+        assert isinstance(second.numeric["Happiness score"], memoryview)
+        # Obsah dat je stejný jako bez cache
+        assert [dict(r) for r in second] == [dict(r) for r in first]
+        assert load_data(path, cache=True, cache_dir=cache_dir) == load_data(path)
+
+
+def test_late_text_value():
+    """Test, že text hluboko v číselném sloupci nedá v různých režimech různé typy."""
+    with tempfile.TemporaryDirectory() as tmp:
+        # 3000 řádků čísel (víc než ukázka pro sniff_format) a na konci "n/a"
+        path = Path(tmp) / "late_text.csv"
+        rows = [f"Country {i},{i / 1000:.3f}" for i in range(3000)] + ["Nowhere,n/a"]
+        path.write_text("Country,Happiness score\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        assert "Happiness score" in sniff_format(path).numeric
+        # Slovníky, sloupcová data i data z cache se shodnou – sloupec je textový
+        plain = load_data(path)
+        columnar = [dict(r) for r in load_data(path, columnar=True)]
+        cached = load_data(path, cache=True, cache_dir=tmp)
+        assert plain == columnar == cached
+        assert plain[0]["Happiness score"] == "0.000"
+        assert plain[-1]["Happiness score"] == "n/a"
+        # Proudové čtení zná jen ukázku, ale "n/a" neztratí
+        streamed = list(iter_data(path))
+        assert streamed[0]["Happiness score"] == 0.0
+        assert streamed[-1]["Happiness score"] == "n/a"
+
+
+def test_live_search_clear(data):
+    """Test, že vymazání hledání obnoví všechna data hned a zahodí naplánované hledání."""
+    widget = FakeWidget()
+    variable = tk.StringVar(master=tk.Tcl())
+    shown = []
+    search = LiveSearch(widget, variable, lambda: data, shown.append)
+    variable.set("czech")
+    widget.run_pending()
+    assert [r["Country"] for r in shown[-1]] == ["Czechia"]
+    variable.set("czechx")
+    search.clear()
+    assert shown[-1] is data and variable.get() == "" and not widget.pending
+
+
+def test_iter_data(path="happiness/world_happiness_2023.csv", region_name="Western Europe"):
+    """Test proudového čtení a řetězení filtrů."""
+    # Dávky mají nejvýše zadanou velikost a dohromady dají celý soubor
+    # Chybějící soubor se nahlásí už při volání, ne až při prvním next()
+    try:
+        iter_data("happiness/neexistuje.csv")
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("iter_data nevyvolal FileNotFoundError")
+    batches = list(iter_data(path, chunk_size=50))
+    assert all(len(b) <= 50 for b in batches)
+    assert sum(len(b) for b in batches) == len(load_data(path))
+    # Filtry nad iterátorem vrací opět iterátor (nic se nenačte dopředu)
+    stream = filter_by_score_range(filter_by_region(iter_data(path), region_name), 7.0, 8.0)
+    assert not isinstance(stream, list)
+    # Výsledek proudu odpovídá filtrování seznamu
+    expected = filter_by_score_range(filter_by_region(load_data(path), region_name), 7.0, 8.0)
+    assert list(stream) == expected
+
+
+def test_indexed_lookup(data, queries=("czech", "LAND", "a", "xyz", "")):
+    """Test, že indexované vyhledávání vrací totéž co procházení seznamu."""
+    # Načtená data mají index pro vyhledávání
+    assert data.lookup is not None
+    for query in queries:
+        # iter(data) je obyčejný proud dat bez indexu – porovnáme výsledky
+        assert find_country(data, query) == list(find_country(iter(data), query))
+    # Stejně pro filtr podle regionu
+    assert filter_by_region(data, "Western Europe") == list(filter_by_region(iter(data), "Western Europe"))
+
+
+def test_score_index(data, score_key="Social support"):
+    """Test seřazeného indexu skóre a hodnoty 0.0."""
+    # Indexovaný rozsahový dotaz dává stejný výsledek jako procházení
+    for low, high in ((0.0, 0.5), (0.8, 1.0), (2.0, 1.0)):
+        expected = list(filter_by_score_range(iter(data), low, high, score_key))
+        assert filter_by_score_range(data, low, high, score_key) == expected
+    # Skóre přesně 0.0 se nesmí ztratit (dříve se vyhodnotilo jako nepravda)
+    zeros = filter_by_score_range(iter(data), 0.0, 0.0, score_key)
+    assert all(to_float(r[score_key]) == 0.0 for r in zeros)
+    assert len(filter_by_score_range(load_panel(), 0.0, 0.0, score_key)) > 0
+
+
+def test_query(data, region_name="Western Europe"):
+    """Test skládání dotazů."""
+    # Dotaz musí vrátit totéž jako ruční řetězení filtrů
+    expected = filter_by_score_range(find_country(filter_by_region(data, region_name), "land"), 7.0, 8.0)
+    query = Query(data).region(region_name).country_like("LAND").score_between(7.0, 8.0)
+    assert query.all() == expected
+    # Bez indexu (proud dat) se vyhodnotí stejně
+    assert Query(iter(data)).region(region_name).country_like("land").score_between(7.0, 8.0).all() == expected
+    # Řazení a omezení počtu
+    top = Query(data).order_by("Happiness score", descending=True).limit(3).all()
+    assert len(top) == 3
+    assert top[0]["Happiness score"] >= top[1]["Happiness score"] >= top[2]["Happiness score"]
+    # Rozsah řazený podle téhož sloupce bere kandidáty v pořadí hodnot – výsledek je stejný jako bez indexu
+    for descending in (False, True):
+        for limit in (None, 4):
+            ranged = Query(data).score_between(5.0, 7.0).order_by("Happiness score", descending).limit(limit)
+            plain = Query(iter(data)).score_between(5.0, 7.0).order_by("Happiness score", descending).limit(limit)
+            assert ranged.all() == plain.all()
+    # Index čísel přeskočí chybějící hodnoty (None i NaN) a čte i desetinnou čárku
+    column = SortedColumn([3.0, math.nan, "2,5", None, "x", 1])
+    assert column.values == [1.0, 2.5, 3.0] and column.positions == [5, 2, 0]
+
+
+def test_group_stats(region_name="Western Europe"):
+    """Test souhrnů po skupinách (NumPy i čistý Python)."""
+    panel = load_panel()
+    # Čistý Python funguje vždy
+    result = vectorized.group_stats(panel, by=("Regional indicator", "Year"), backend="python")
+    assert (region_name, 2023) in result
+    assert result[region_name, 2023]["Happiness score"]["mean"] > 0
+    # S NumPy musí vyjít stejné skupiny i hodnoty (až na zaokrouhlení)
+    if vectorized.HAS_NUMPY:
+        fast = vectorized.group_stats(panel, by=("Regional indicator", "Year"), backend="numpy")
+        assert list(fast) == list(result)
+        for key, columns in result.items():
+            for stat, value in columns["Happiness score"].items():
+                assert math.isclose(value, fast[key]["Happiness score"][stat], rel_tol=1e-9, abs_tol=1e-12)
+        # Rozsahový filtr přes masku vrací stejné záznamy
+        assert vectorized.filter_by_score_range(panel, 6.0, 7.0) == filter_by_score_range(panel, 6.0, 7.0)
+
+
+def test_export(data):
+    """Test proudového exportu do souborů."""
+    rows = [dict(r) for r in data]
+    with tempfile.TemporaryDirectory() as folder:
+        # NDJSON s kompresí gzip – jeden záznam na řádek
+        path = os.path.join(folder, "data.ndjson.gz")
+        assert export_rows(data, path, batch_size=50) == len(rows)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == rows
+        # JSON pole zapisované po částech
+        path = os.path.join(folder, "data.json")
+        export_rows(iter(data), path, batch_size=50)
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == rows
+        # Sloupcový binární formát lze přečíst zpět
+        path = os.path.join(folder, "data.hcol")
+        export_rows(data, path, batch_size=50)
+        assert list(read_columnar(path)) == rows
+
+
+def test_benchmark_compare():
+    """Test porovnání výsledků benchmarku vykreslování (bez displeje)."""
+    grid = list(benchmark.cases(widths=(640,), chessboard=(2, 8), target=(10,)))
+    assert [c[0] for c in grid] == ["lines", "chessboard", "chessboard", "target"]
+    record = {"task": "chessboard", "param": 8, "mode": "auto", "width": 640, "height": 360,
+              "cold_s": 0.010, "redraw_s": 0.004, "tcl_calls": 3, "tcl_calls_redraw": 2, "items": 64}
+    before = {"meta": {}, "results": [record]}
+    # Šum v rámci prahu není regrese, víc volání Tcl ano
+    assert benchmark.compare(before, {"results": [dict(record, redraw_s=0.0045)]}) == []
+    regressions = benchmark.compare(before, {"results": [dict(record, tcl_calls_redraw=64)]})
+    assert [r["field"] for r in regressions] == ["tcl_calls_redraw"]
+
+
+def test_scene_cache():
+    """Test LRU mezipaměti scén (vyřazení podle počtu i velikosti)."""
+    layout = [("oval", ("ring", 1), (0, 0, 10, 10), {"fill": "#fff"})]
+    cache = SceneCache(max_bytes=1000, max_entries=2)
+    builds = []
+    build = lambda: builds.append(1) or layout
+    assert cache.get_or_build(("target", 1), build) is layout
+    assert cache.get_or_build(("target", 1), build) is layout
+    assert len(builds) == 1 and cache.stats["hits"] == 1
+    # Třetí položka vyřadí nejdéle nepoužitou
+    cache.put(("target", 2), layout, size=10)
+    cache.get(("target", 1))
+    cache.put(("target", 3), layout, size=10)
+    assert ("target", 2) not in cache and ("target", 1) in cache
+    # Překročení paměťového limitu vyřazuje, příliš velká hodnota se neuloží
+    cache.put(("big",), layout, size=995)
+    assert list(cache._entries) == [("big",)] and cache.nbytes == 995
+    cache.put(("huge",), layout, size=5000)
+    assert ("huge",) not in cache
+
+
+def test_primes(n=10_000):
+    """Test Eratosthenova síta (celého i segmentovaného) a statistiky mezer."""
+    slow = [k for k in range(2, n + 1) if all(k % d for d in range(2, int(k ** 0.5) + 1))]
+    assert primes.primes_up_to(n) == slow
+    segmented = [p for chunk in primes.segmented_primes(n, segment_size=97) for p in chunk]
+    assert segmented == slow
+    assert primes.count_primes(n) == len(slow) and primes.count_primes(1) == 0
+    # Nad SIEVE_LIMIT se počítá po segmentech – musí vyjít stejně jako jedno síto
+    big = primes.SIEVE_LIMIT + 1000
+    assert primes.count_primes(big) == primes.sieve(big).count(1)
+    assert primes.count_primes(10 ** 6) == 78498
+    stats = primes.GapStats()
+    for chunk in primes.prime_chunks(100, chunk_size=7):
+        stats.add(chunk)
+    assert stats.count == 25 and stats.max_gap == 8 and stats.mean_gap == (97 - 2) / 24
+    # Jednotlivé segmenty (výpočty úlohy 6 v poolu) dají dohromady stejný výsledek
+    bounds = list(range(0, n + 1, 1000)) + [n + 1]
+    assert [p for low, high in zip(bounds, bounds[1:]) for p in primes.primes_in_range(low, high)] == slow
+
+
+def test_raster_geometry():
+    """Test rastrového vykreslení bez displeje: šířky čar a hrany polí šachovnice."""
+    # Čáry vedle sebe (střed v polovině tloušťky) pokryjí řádek bez mezer a překryvů
+    stripes, left = [], 0
+    for i, weight in enumerate([1, 3, 2, 5, 1, 1, 4, 7]):
+        stripes.append((left + weight / 2, weight, f"#0000{i:02x}"))
+        left += weight
+    pixels = raster.lines_pixels(stripes, 40)
+    assert pixels[:left] == [color for x, weight, color in stripes for _ in range(weight)]
+    assert pixels[left:] == [raster.BACKGROUND] * (40 - left)
+    # Samostatná čára má přesně svou tloušťku (i lichou) a leží kolem x
+    for weight in range(1, 9):
+        for x in (10, 11):
+            row = raster.lines_pixels([(x, weight, "#ff0000")], 40)
+            assert row.count("#ff0000") == weight
+            assert row.index("#ff0000") == math.floor(x - weight / 2 + 0.5)
+    # Hrany šachovnice: size + 1 hodnot od 0 do board, pole se liší nejvýš o pixel
+    for size, board in [(8, 400), (3, 100), (30, 299)]:
+        edges = raster.chessboard_edges(size, board)
+        assert len(edges) == size + 1 and edges[0] == 0 and edges[-1] == board
+        widths = [b - a for a, b in zip(edges, edges[1:])]
+        assert max(widths) - min(widths) <= 1
+
+
+def test_text_writer_stream():
+    """Test postupného výpisu: položky přicházejí po dávkách (feed), výpis skončí po close()."""
+    text = FakeText()
+    done = []
+    writer = TextWriter(text, sep=", ")
+    writer.start(on_done=done.append)
+    for chunk in primes.segmented_primes(100, segment_size=30):
+        writer.feed(map(str, chunk))
+        text.run_pending()
+    # Fronta je vypsaná, ale výpis čeká na další položky
+    assert writer.running and not done
+    writer.close()
+    text.run_pending()
+    assert done == [25] and not writer.running
+    assert text.content == ", ".join(map(str, primes.primes_up_to(100))) + "\n"
+
+
+def test_text_writer_chunks():
+    """Test hranic dávek (jedno insert na dávku, oddělovač přesně mezi položkami) a závěrečného zápisu."""
+    # 20 položek po 7: dávky 7 + 7 + 6, pak už se jen počítá; na konci souhrn skrytých
+    text = FakeText()
+    done = []
+    writer = TextWriter(text, max_items=20, batch=7)
+    writer.write(map(str, range(50)), on_done=done.append)
+    text.run_pending()
+    assert done == [50] and not writer.running
+    assert text.inserts == 3 + 1
+    assert text.content == "\n".join(map(str, range(20))) + "\n… a dalších 30 (zobrazeno prvních 20)\n"
+    # Limit je násobkem dávky a nic se neskrylo – závěr je jen konec řádku
+    text = FakeText()
+    writer = TextWriter(text, sep=", ", max_items=21, batch=7)
+    writer.start(on_done=done.append)
+    for chunk in ([0, 1, 2], [], [3, 4, 5, 6, 7], [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20]):
+        writer.feed(map(str, chunk))
+        text.run_pending()
+    writer.close()
+    text.run_pending()
+    assert done[-1] == 21
+    assert text.content == ", ".join(map(str, range(21))) + "\n"
+    # Prázdný výpis zapíše jen konec řádku
+    text = FakeText()
+    TextWriter(text).write([], on_done=done.append)
+    text.run_pending()
+    assert done[-1] == 0 and text.content == "\n" and text.inserts == 1
+
+
+def test_frame_scheduler():
+    """Test slučování překreslení: víc požadavků před snímkem = jedno volání (poslední požadavek)."""
+    widget = FakeWidget()
+    scheduler = FrameScheduler(widget, frame_ms=16)
+    drawn = []
+    for size in (100, 200, 300):
+        scheduler.request(lambda size=size: drawn.append(size))
+    # Naplánované je jediné volání a provede jen poslední velikost
+    assert len(widget.pending) == 1
+    widget.run_pending()
+    assert drawn == [300]
+    assert scheduler.stats == {"requested": 3, "drawn": 1, "skipped": 2}
+    # Zrušený požadavek se neprovede, flush() provede čekající hned
+    scheduler.request(lambda: drawn.append("zrušeno"))
+    scheduler.cancel()
+    assert not widget.pending
+    scheduler.request(lambda: drawn.append("hned"))
+    scheduler.flush()
+    widget.run_pending()
+    assert drawn == [300, "hned"]
+    assert scheduler.stats == {"requested": 5, "drawn": 2, "skipped": 3}
+
+
+def test_tcl_quoting():
+    """Test uvozování pro CanvasBatch: hodnota i seznam projdou interpretem Tcl beze změny."""
+    interp = tk.Tcl()
+    values = ["", "Segoe UI", "a b", "$x", "[exit]", "{", "}", "a}b{", "\\", "a\\nb", "a\nb", "a\nb{",
+              "a\tb\\", '"q"', "x;y", "#c", 10]
+    for value in values:
+        assert interp.eval("set v " + tcl_word(value)) == str(value)
+    # Seznam (např. font) – počet prvků i každý prvek zůstanou zachované
+    interp.eval("set v " + tcl_word(values))
+    assert int(interp.eval("llength $v")) == len(values)
+    for i, value in enumerate(values):
+        assert interp.eval(f"lindex $v {i}") == str(value)
+    assert tcl_list_element("a\nb{") == "a\\nb\\{"
+
+
+def test_scene_diff():
+    """Test retained-mode scény: položky se znovu používají a posílají se jen změny."""
+    canvas = FakeCanvas()
+    scene = Scene(canvas)
+    scene.begin()
+    scene.rectangle("a", 0, 0, 10, 10, fill="red")
+    scene.rectangle("b", 10, 0, 20, 10, fill="blue")
+    scene.oval("c", 0, 10, 10, 20, fill="green", outline="black")
+    scene.end()
+    assert [scene.items[k][0] for k in "abc"] == [1, 2, 3]
+    assert len(canvas.tk.scripts) == 1 and canvas.tk.scripts[0].count(" create ") == 3
+    assert scene.stats == {"created": 3, "moved": 0, "configured": 0, "deleted": 0, "evals": 1}
+
+    # Druhý snímek: a beze změny, b posunutá, c zmizí, nová d mezi a a b
+    def second_frame():
+        scene.begin()
+        scene.rectangle("a", 0, 0, 10, 10, fill="red")
+        scene.line("d", 0, 0, 20, 20, fill="black")
+        scene.rectangle("b", 12, 0, 22, 10, fill="blue", outline="")
+        scene.end()
+
+    second_frame()
+    changes, order = canvas.tk.scripts[1].splitlines(), canvas.tk.scripts[2].splitlines()
+    assert [line for line in changes if " coords " in line] == ['.canvas coords "2" "12" "0" "22" "10"']
+    # Změnila se jen volba outline – fill se znovu neposílá
+    assert [line for line in changes if " itemconfigure " in line] == ['.canvas itemconfigure "2" -outline ""']
+    assert [line for line in changes if " delete " in line] == ['.canvas delete "3"']
+    assert sum(" create " in line for line in changes) == 1 and scene.items["d"][0] == 4
+    # Nová položka se vmísila mezi staré – pořadí vrstev se obnoví podle pořadí kreslení
+    assert [line for line in order if " raise " in line] == ['.canvas raise "1"', '.canvas raise "4"',
+                                                              '.canvas raise "2"']
+    assert scene.stats == {"created": 4, "moved": 1, "configured": 1, "deleted": 1, "evals": 3}
+    # Stejný snímek znovu: žádná změna, žádné volání Tcl
+    second_frame()
+    assert len(canvas.tk.scripts) == 3
+    assert scene.stats == {"created": 4, "moved": 1, "configured": 1, "deleted": 1, "evals": 3}
+
+
+class FakeFrame:
+    """Náhrada rámce úlohy pro FrameCache: zaznamenává grid/grid_remove/destroy do společného logu."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+        self.alive = True
+
+    def grid(self, **options):
+        self.log.append(("grid", self.name))
+
+    def grid_remove(self):
+        self.log.append(("hide", self.name))
+
+    def winfo_exists(self):
+        return self.alive
+
+    def destroy(self):
+        self.alive = False
+        self.log.append(("destroy", self.name))
+
+
+def test_frame_cache():
+    """Test LRU rámců úloh: vyřazení nejdéle nepoužitého, on_evict před zničením, reset."""
+    log = []
+    cache = FrameCache(None, limit=2, on_evict=lambda frame: log.append(("evict", frame.name)))
+
+    def builder(name):
+        return lambda parent: FakeFrame(name, log)
+
+    a = cache.show("a", builder("a"))
+    cache.show("b", builder("b"))
+    # Návrat k "a" rámec nevytváří znovu, jen skryje "b" a zobrazí "a"
+    log.clear()
+    assert cache.show("a", builder("jiný")) is a
+    assert log == [("hide", "b"), ("grid", "a")]
+    # Třetí rámec vyřadí nejdéle nepoužitý ("b"); on_evict se volá před destroy
+    log.clear()
+    cache.show("c", builder("c"))
+    assert log == [("hide", "a"), ("grid", "c"), ("evict", "b"), ("destroy", "b")]
+    assert "b" not in cache and "a" in cache and cache.current == "c"
+    # Aktuální rámec se nevyřadí ani při limitu 0
+    cache.limit = 0
+    cache.show("d", builder("d"))
+    assert cache.current == "d" and "d" in cache and "c" not in cache and "a" not in cache
+    # reset(key) zahodí jeden rámec, při dalším zobrazení vznikne znovu
+    log.clear()
+    cache.reset("d")
+    assert log == [("evict", "d"), ("destroy", "d")] and cache.current is None
+    d = cache.show("d", builder("d"))
+    assert d.alive and cache.current == "d"
+    # reset() zahodí všechny
+    cache.limit = 2
+    cache.show("e", builder("e"))
+    log.clear()
+    cache.reset()
+    assert sorted(log) == [("destroy", "d"), ("destroy", "e"), ("evict", "d"), ("evict", "e")]
+    assert "d" not in cache and "e" not in cache and cache.current is None
+
+
+def test_task_registry():
+    """Test registru úloh: názvy a pořadí bez importu modulů úloh, import až při load()."""
+    registry = TaskRegistry().discover("tasks")
+    assert [t.order for t in registry] == sorted(t.order for t in registry)
+    assert registry[0].title == "1. Pozdrav funkcí" and len(registry) >= 8
+    assert all(t.module not in sys.modules for t in registry if t.module != "tasks.fizzbuzz")
+    assert read_metadata("tasks/fizzbuzz.py") == {"TITLE": "3. FizzBuzz", "ORDER": 3}
+    assert callable(registry[2].load()) and "tasks.fizzbuzz" in sys.modules
+    # Registrace funkce dekorátorem (main.py) – řadí se podle order
+    local = TaskRegistry()
+    local.task("B", order=2)(lambda parent: None)
+    build_a = local.task("A", order=1)(lambda parent: "a")
+    assert [t.title for t in local] == ["A", "B"] and local[0].load() is build_a
+    # Rozbité vstupní body se přeskočí s hlášením, ostatní úlohy zůstanou
+    entry_points = [metadata.EntryPoint("chybi", "neexistujici_balik.ulohy:build", ENTRY_POINT_GROUP),
+                    metadata.EntryPoint("relativni", ".ulohy:build", ENTRY_POINT_GROUP),
+                    metadata.EntryPoint("pozdrav", "tasks.greeting:build", ENTRY_POINT_GROUP)]
+    original = registry_module._entry_points
+    registry_module._entry_points = lambda group: entry_points
+    try:
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            plugins = TaskRegistry().discover("tasks")
+    finally:
+        registry_module._entry_points = original
+    assert len(plugins) == len(registry) + 1
+    assert "chybi" in err.getvalue() and "relativni" in err.getvalue()
+
+
+def _wait(widget, seconds=0.01):
+    """Prochází frontu after s malou pauzou (pool mezitím počítá)."""
+    while widget.pending:
+        time.sleep(seconds)
+        widget.run_pending()
+
+
+def _slow_fizzbuzz(n, seconds):
+    time.sleep(seconds)
+    return fizzbuzz(n)
+
+
+def test_compute_replaces_previous():
+    """Test, že nové spuštění úlohy zruší předchozí – pomalejší starší výpočet nepřepíše novější."""
+    widget = FakeWidget()
+    widget.runner = TaskRunner(widget, kind="thread", max_workers=2, poll_ms=10)
+    shown = []
+    compute(widget, _slow_fizzbuzz, 20, 0.2, on_done=shown.append)
+    compute(widget, _slow_fizzbuzz, 5, 0.0, on_done=shown.append)
+    _wait(widget)
+    time.sleep(0.3)
+    widget.run_pending()
+    assert shown == [fizzbuzz(5)]
+    widget.runner.shutdown()
+
+
+def test_compute_chunks():
+    """Test výpočtu po úsecích: výpis odpovídá výpočtu najednou, nový výpis starší zastaví."""
+    from tasks.multiplication import multiplication_rows, multiplication_table
+    from tasks.fizzbuzz import fizzbuzz_range
+    # Bez TaskRunneru se úseky počítají hned, další se plánují přes after_idle
+    text = FakeText()
+    writer = TextWriter(text)
+    writer.start()
+    compute_chunks(text, writer, fizzbuzz_range, 1, 101, step=7)
+    text.run_pending()
+    assert text.content == "\n".join(fizzbuzz(100)) + "\n"
+    writer.start()
+    compute_chunks(text, writer, multiplication_rows, 1, 13, 9, step=5)
+    text.run_pending()
+    assert text.content == "\n".join(multiplication_table(12, 9)) + "\n"
+    # Druhý výpis spuštěný před koncem prvního – ve výsledku je jen druhý
+    seen = []
+    writer.start()
+    compute_chunks(text, writer, fizzbuzz_range, 1, 1001, step=10, on_chunk=seen.append)
+    writer.start()
+    compute_chunks(text, writer, fizzbuzz_range, 1, 16, step=10)
+    text.run_pending()
+    assert len(seen) == 1 and text.content == "\n".join(fizzbuzz(15)) + "\n"
+    # Pool ve vláknech: stejný výsledek a po skončení žádné čekající výpočty
+    widget = FakeText()
+    widget.runner = TaskRunner(widget, kind="thread", max_workers=2, poll_ms=5)
+    writer = TextWriter(widget, sep=", ")
+    done = []
+    writer.start(on_done=done.append)
+    compute_chunks(widget, writer, primes.primes_in_range, 2, 1001, step=100)
+    _wait(widget)
+    assert done == [168] and widget.content == ", ".join(map(str, primes.primes_up_to(1000))) + "\n"
+    widget.runner.shutdown()
+
+
+def test_task_runner_timeout():
+    """Test limitu výpočtu: vyprší čekající i běžící výpočet, chyba dojde vždy do on_error."""
+    widget = FakeWidget()
+    busy, results = [], []
+    runner = TaskRunner(widget, kind="thread", max_workers=1, poll_ms=10, on_busy=busy.append)
+    # Jediné vlákno je obsazené, druhý výpočet čeká ve frontě a vyprší
+    runner.submit(time.sleep, 0.3, on_done=lambda r: results.append("slept"), on_error=results.append)
+    runner.submit(sum, [1, 2], on_done=results.append, on_error=results.append, timeout=0.05)
+    _wait(widget)
+    assert isinstance(results[0], TimeoutError) and results[1] == "slept"
+    assert busy[-1] == 0
+    runner.shutdown()
+
+    # Běžící výpočet v procesu: procesy se ukončí, ostatní výpočty doběhnou v novém poolu
+    results = []
+    runner = TaskRunner(widget, kind="process", max_workers=1, poll_ms=10)
+    runner.submit(time.sleep, 30, on_done=results.append, on_error=results.append, timeout=0.3)
+    runner.submit(sum, [1, 2], on_done=results.append, on_error=results.append)
+    start = time.perf_counter()
+    _wait(widget)
+    assert isinstance(results[0], TimeoutError) and results[1] == 3
+    assert time.perf_counter() - start < 10
+    runner.shutdown()
+
+
 if __name__ == "__main__":
     # Načtení dat pro testy
     try:
@@ -63,6 +744,32 @@ if __name__ == "__main__":
         test_find_country(csv_data)
         test_filter_by_region(csv_data)
         test_filter_by_score_range(csv_data, score_key="Happiness score")
+        test_load_columnar()
+        test_load_panel()
+        test_sniff_format()
+        test_load_cached()
+        test_iter_data()
+        test_late_text_value()
+        test_live_search_clear(csv_data)
+        test_indexed_lookup(csv_data)
+        test_score_index(csv_data)
+        test_query(csv_data)
+        test_group_stats()
+        test_export(csv_data)
+        test_benchmark_compare()
+        test_scene_cache()
+        test_frame_scheduler()
+        test_primes()
+        test_tcl_quoting()
+        test_scene_diff()
+        test_frame_cache()
+        test_task_registry()
+        test_text_writer_stream()
+        test_text_writer_chunks()
+        test_raster_geometry()
+        test_task_runner_timeout()
+        test_compute_replaces_previous()
+        test_compute_chunks()
         print("Všechny testy proběhly úspěšně.")
     except FileNotFoundError:
         print("Chyba: Soubor nebyl nalezen.")